@@ -0,0 +1,95 @@
+"""
+JSON encoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers get faster (de)serialization without a hard dependency.
+"""
+
+import json
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are memory-mapped instead of read into a bytes buffer
+MMAP_THRESHOLD = 64 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # orjson rejects some inputs json accepts (e.g. non-str keys, ints over 64 bits)
+            pass
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def read_json(file_path: Any) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Small files are read in a single read. With orjson, large files are
+    memory-mapped and parsed in place, so the OS pages them in on demand
+    instead of copying them into a Python bytes buffer first.
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(f.read())
+
+
+def write_bytes_atomic(file_path: Any, data: bytes, durable: bool = True) -> None:
+    """
+    Write bytes atomically via a temporary file in the same directory.
+    
+    When durable is False the fsync is skipped: the file is still replaced
+    atomically, but a power loss may lose the latest write. Use this only
+    for regenerable data.
+    """
+    file_path = Path(file_path)
+    with tempfile.NamedTemporaryFile(
+        mode='wb',
+        dir=file_path.parent,
+        delete=False,
+        suffix='.tmp'
+    ) as temp_file:
+        try:
+            temp_file.write(data)
+            if durable:
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+        except BaseException:
+            temp_file.close()
+            os.unlink(temp_file.name)
+            raise
+    
+    # Atomic replace (overwrites the destination on Windows too)
+    os.replace(temp_file.name, file_path)
+
+
+def write_json_atomic(file_path: Any, data: Any, durable: bool = True) -> None:
+    """Write data atomically to a JSON file, indented for readability."""
+    write_bytes_atomic(file_path, dumps(data, indent=True), durable=durable)
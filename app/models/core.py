@@ -1,33 +1,47 @@
+import sys
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
 
-class Webhook(BaseModel):
+@dataclass(slots=True)
+class Webhook:
     name: str
     url: str
 
 
-class Organization(BaseModel):
+@dataclass(slots=True)
+class Organization:
     id: str
     name: str
     owner_id: str
-    webhooks: List[Webhook] = Field(default_factory=list)
+    webhooks: List[Webhook] = field(default_factory=list)
 
 
-class Prospect(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Prospect:
     firstName: str
     lastName: str
     email: str
     phone: str
+    
+    def __post_init__(self) -> None:
+        # Intern fields so repeated values share storage and equality checks short-circuit on identity
+        object.__setattr__(self, 'firstName', sys.intern(self.firstName))
+        object.__setattr__(self, 'lastName', sys.intern(self.lastName))
+        object.__setattr__(self, 'email', sys.intern(self.email))
+        object.__setattr__(self, 'phone', sys.intern(self.phone))
 
 
-class OrganizationProspects(BaseModel):
+@dataclass(slots=True)
+class OrganizationProspects:
     next_prospect_index: int = 1
-    prospects: List[Prospect] = Field(default_factory=list)
+    prospects: List[Prospect] = field(default_factory=list)
 
 
-class GeneratedProspectsData(BaseModel):
-    data: Dict[str, OrganizationProspects] = Field(default_factory=dict)
+@dataclass(slots=True)
+class GeneratedProspectsData:
+    data: Dict[str, OrganizationProspects] = field(default_factory=dict)
     
     def get_org_prospects(self, org_id: str) -> OrganizationProspects:
         if org_id not in self.data:
@@ -46,4 +60,4 @@ class AppState(BaseModel):
     selected_profile: Optional[str] = None
     
     class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
+        arbitrary_types_allowed = True
@@ -1,5 +1,10 @@
-from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, Union, List
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, Any, Optional, Union, List, Callable, ClassVar, Tuple
 from enum import Enum
 
 
@@ -18,6 +23,16 @@ class DynamicFieldType(str, Enum):
     PHONE = "phone"
 
 
+# Private per-user directory for pickled schema caches. Never next to the schema
+# files: anyone able to write there could otherwise plant a pickle that runs code.
+SCHEMA_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'bonzobuddy' / 'schemas'
+
+
+# Fixed order of prospect values passed to compiled schemas, and each field's index
+DYNAMIC_FIELD_ORDER = tuple(field.value for field in DynamicFieldType)
+DYNAMIC_FIELD_INDEX = {name: index for index, name in enumerate(DYNAMIC_FIELD_ORDER)}
+
+
 class SchemaNode(BaseModel):
     """
     Represents a single node in a payload schema.
@@ -35,15 +50,28 @@ class SchemaNode(BaseModel):
     # For object types
     properties: Optional[Dict[str, 'SchemaNode']] = None
     
-    @property
-    def node_type(self) -> SchemaNodeType:
-        """Determine the node type based on the field configuration."""
+    # Derived once at construction so payload generation avoids re-checking fields
+    _node_type: SchemaNodeType = PrivateAttr(default=SchemaNodeType.STATIC)
+    _dynamic_key: Optional[str] = PrivateAttr(default=None)
+    _dynamic_index: Optional[int] = PrivateAttr(default=None)
+    _items: Tuple[Tuple[str, 'SchemaNode'], ...] = PrivateAttr(default=())
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the node type, the prospect key/index and the property pairs."""
         if self.dynamic is not None:
-            return SchemaNodeType.DYNAMIC
+            self._node_type = SchemaNodeType.DYNAMIC
+            self._dynamic_key = self.dynamic.value
+            self._dynamic_index = DYNAMIC_FIELD_INDEX[self._dynamic_key]
         elif self.properties is not None:
-            return SchemaNodeType.OBJECT
+            self._node_type = SchemaNodeType.OBJECT
+            self._items = tuple(self.properties.items())
         else:
-            return SchemaNodeType.STATIC
+            self._node_type = SchemaNodeType.STATIC
+    
+    @property
+    def node_type(self) -> SchemaNodeType:
+        """The node type, determined by the field configuration at construction."""
+        return self._node_type
     
     def get_value(self, prospect_data: Dict[str, Any]) -> Any:
         """
@@ -55,17 +83,31 @@ class SchemaNode(BaseModel):
         Returns:
             The value for this field in the generated payload
         """
-        if self.node_type == SchemaNodeType.DYNAMIC:
-            return prospect_data.get(self.dynamic.value)
-        elif self.node_type == SchemaNodeType.STATIC:
+        node_type = self._node_type
+        if node_type is SchemaNodeType.DYNAMIC:
+            return prospect_data.get(self._dynamic_key)
+        elif node_type is SchemaNodeType.STATIC:
             return self.static
-        elif self.node_type == SchemaNodeType.OBJECT:
-            if not self.properties:
-                return {}
+        elif node_type is SchemaNodeType.OBJECT:
+            result: Dict[str, Any] = {}
+            if not self._items:
+                return result
             
-            result = {}
-            for field_name, field_node in self.properties.items():
-                result[field_name] = field_node.get_value(prospect_data)
+            # Walk nested objects with an explicit stack instead of recursing
+            stack = [(self._items, result)]
+            while stack:
+                items, out = stack.pop()
+                for field_name, field_node in items:
+                    child_type = field_node._node_type
+                    if child_type is SchemaNodeType.DYNAMIC:
+                        out[field_name] = prospect_data.get(field_node._dynamic_key)
+                    elif child_type is SchemaNodeType.OBJECT:
+                        nested: Dict[str, Any] = {}
+                        out[field_name] = nested
+                        if field_node._items:
+                            stack.append((field_node._items, nested))
+                    else:
+                        out[field_name] = field_node.static
             return result
         
         return None
@@ -89,6 +131,19 @@ class IntegrationSchema(BaseModel):
     # Optional metadata
     description: Optional[str] = None
     
+    # Bump when the pickled layout changes so stale schema caches are ignored
+    CACHE_VERSION: ClassVar[int] = 4
+    
+    # (field_name, field_node) pairs, precomputed at construction
+    _items: Tuple[Tuple[str, SchemaNode], ...] = PrivateAttr(default=())
+    
+    # Generated payload builder, compiled lazily on first use
+    _compiled: Optional[Callable[[tuple], Dict[str, Any]]] = PrivateAttr(default=None)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the (field_name, field_node) pairs."""
+        self._items = tuple(self.fields.items())
+    
     def generate_payload(self, prospect_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate a complete payload using this schema and prospect data.
@@ -99,10 +154,68 @@ class IntegrationSchema(BaseModel):
         Returns:
             Complete payload dictionary ready for JSON serialization
         """
-        payload = {}
-        for field_name, field_node in self.fields.items():
-            payload[field_name] = field_node.get_value(prospect_data)
-        return payload
+        prospect_values = tuple(prospect_data.get(name) for name in DYNAMIC_FIELD_ORDER)
+        return self.generate_payload_from_values(prospect_values)
+    
+    def generate_payload_from_values(self, prospect_values: tuple) -> Dict[str, Any]:
+        """
+        Generate a complete payload from prospect values in DYNAMIC_FIELD_ORDER.
+        
+        Args:
+            prospect_values: (firstName, lastName, email, phone) tuple
+            
+        Returns:
+            Complete payload dictionary ready for JSON serialization
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
+        return compiled(prospect_values)
+    
+    def compile(self) -> Callable[[tuple], Dict[str, Any]]:
+        """
+        Compile this schema into a flat Python function.
+        
+        The schema tree is walked once and emitted as a single dict literal,
+        so generating a payload no longer recurses through SchemaNode or
+        dispatches on node_type. Field names and simple static values are
+        embedded as literals; other static values are bound as constants.
+        Dynamic values are read by index from a DYNAMIC_FIELD_ORDER tuple.
+        """
+        constants: List[Any] = []
+        body = self._compile_fields(self._items, constants)
+        source = f"def _generate_payload(v):\n    return {body}\n"
+        
+        namespace: Dict[str, Any] = {f"_c{i}": value for i, value in enumerate(constants)}
+        exec(compile(source, f"<schema {self.name}>", "exec"), namespace)
+        
+        self._compiled = namespace["_generate_payload"]
+        return self._compiled
+    
+    @classmethod
+    def _compile_fields(cls, fields: Tuple[Tuple[str, SchemaNode], ...], constants: List[Any]) -> str:
+        """Emit a dict literal expression for (field_name, field_node) pairs."""
+        items = []
+        for field_name, field_node in fields:
+            items.append(f"{field_name!r}: {cls._compile_node(field_node, constants)}")
+        return "{" + ", ".join(items) + "}"
+    
+    @classmethod
+    def _compile_node(cls, node: SchemaNode, constants: List[Any]) -> str:
+        """Emit the expression producing the value of a single schema node."""
+        node_type = node._node_type
+        if node_type is SchemaNodeType.DYNAMIC:
+            return f"v[{node._dynamic_index}]"
+        if node_type is SchemaNodeType.OBJECT:
+            return cls._compile_fields(node._items, constants)
+        
+        value = node.static
+        if value is None or isinstance(value, (str, bool, int)):
+            return repr(value)
+        
+        # Containers and floats are bound by reference, matching get_value
+        constants.append(value)
+        return f"_c{len(constants) - 1}"
     
     @classmethod
     def from_json_file(cls, file_path: str, category: str, integration: str, profile: Optional[str] = None) -> 'IntegrationSchema':
@@ -111,11 +224,20 @@ class IntegrationSchema(BaseModel):
         
         This method provides backwards compatibility during the migration.
         """
-        import json
-        from pathlib import Path
+        from .. import json_io
+        
+        stat = os.stat(file_path)
+        cache_key = (cls.CACHE_VERSION, stat.st_mtime_ns, stat.st_size, category, integration, profile)
+        cache_path = cls._cache_path(file_path)
         
-        with open(file_path, 'r') as f:
-            schema_data = json.load(f)
+        if cache_path is not None:
+            cached = cls._load_cached(cache_path, cache_key)
+            if cached is not None:
+                return cached
+        
+        schema_data = json_io.read_json(file_path)
+        if not isinstance(schema_data, dict):
+            raise ValueError(f"Schema file must contain a JSON object, got {type(schema_data).__name__}")
         
         # Convert JSON schema format to Pydantic models
         fields = {}
@@ -131,17 +253,71 @@ class IntegrationSchema(BaseModel):
         # Extract name from filename
         file_stem = Path(file_path).stem
         
-        return cls(
+        schema = cls(
             name=file_stem,
             category=category,
             integration=integration,
             profile=profile,
             fields=fields
         )
+        if cache_path is not None:
+            cls._write_cache(cache_path, cache_key, schema)
+        return schema
+    
+    @staticmethod
+    def _cache_path(file_path: str) -> Optional[Path]:
+        """Return the schema's cache file in SCHEMA_CACHE_DIR, or None if the directory can't be created."""
+        try:
+            SCHEMA_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            return None
+        name = hashlib.sha256(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return SCHEMA_CACHE_DIR / f"{name}.pickle"
+    
+    @classmethod
+    def _load_cached(cls, cache_path: Path, cache_key: tuple) -> Optional['IntegrationSchema']:
+        """Load a pickled schema if the cache matches the source file's stat key."""
+        try:
+            with open(cache_path, 'rb') as f:
+                key, schema = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible cache; it will be rewritten
+            return None
+        
+        if key != cache_key or not isinstance(schema, cls):
+            return None
+        return schema
+    
+    @staticmethod
+    def _write_cache(cache_path: Path, cache_key: tuple, schema: 'IntegrationSchema') -> None:
+        """Write the schema cache atomically; failures only cost the next cold start."""
+        from .. import json_io
+        
+        try:
+            data = pickle.dumps((cache_key, schema), protocol=pickle.HIGHEST_PROTOCOL)
+            json_io.write_bytes_atomic(cache_path, data, durable=False)
+        except Exception:
+            pass
+    
+    def __getstate__(self) -> Dict[Any, Any]:
+        # Compiled functions are built with exec() and cannot be pickled
+        state = super().__getstate__()
+        state['__pydantic_private__'] = {**(state.get('__pydantic_private__') or {}), '_compiled': None}
+        return state
     
     @classmethod
     def _convert_json_field(cls, field_def: Dict[str, Any]) -> SchemaNode:
-        """Convert old JSON field definition to SchemaNode."""
+        """
+        Convert old JSON field definition to SchemaNode.
+        
+        Raises:
+            ValueError: If the field definition or its properties are not JSON objects
+        """
+        if not isinstance(field_def, dict):
+            raise ValueError(f"Schema field must be a JSON object, got {type(field_def).__name__}")
+        
         node_kwargs = {
             "type": field_def.get("type", "string")
         }
@@ -160,6 +336,8 @@ class IntegrationSchema(BaseModel):
         
         # Handle nested objects
         if "properties" in field_def:
+            if not isinstance(field_def["properties"], dict):
+                raise ValueError(f"Schema properties must be a JSON object, got {type(field_def['properties']).__name__}")
             properties = {}
             for prop_name, prop_def in field_def["properties"].items():
                 properties[prop_name] = cls._convert_json_field(prop_def)
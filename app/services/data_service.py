@@ -1,55 +1,58 @@
-import json
 import os
-import tempfile
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from ..models.core import Organization, Webhook, GeneratedProspectsData, OrganizationProspects
+from .. import json_io
+from ..models.core import Organization, Webhook, Prospect, GeneratedProspectsData, OrganizationProspects
+
+# Keys of a prospect entry in the prospects log
+_PROSPECT_FIELDS = frozenset(('firstName', 'lastName', 'email', 'phone'))
 
 
 class DataService:
+    # Fold the prospects log into the snapshot after this many appends
+    PROSPECTS_LOG_COMPACT_EVERY = 100
+    # Seconds to wait for further organization changes before writing the file
+    ORGANIZATIONS_FLUSH_DELAY = 0.5
+    
     def __init__(self, base_path: str = "."):
         self.base_path = Path(base_path)
         self.org_webhooks_file = self.base_path / "org_webhooks.json"
         self.generated_prospects_file = self.base_path / "generated_prospects.json"
+        # Append-only log of prospects saved since the last snapshot, one JSON object per line
+        self.generated_prospects_log_file = self.base_path / "generated_prospects.jsonl"
+        self._prospects_log_appends = 0
+        
+        # Parsed contents of org_webhooks.json, kept in memory. While dirty it holds
+        # organizations saved but not yet written (see save_organizations); otherwise
+        # it is reloaded when the file's (mtime_ns, size) changes underneath us.
+        self._organizations_data: Any = None
+        self._organizations_stat: Optional[Tuple[int, int]] = None
+        self._organizations_dirty = False
+        self._organizations_flush_timer: Optional[threading.Timer] = None
+        self._organizations_lock = threading.Lock()
         
         # Ensure files exist
         self._ensure_files_exist()
+        
+        # Start from a clean snapshot; this also drops any torn line from a crash mid-append
+        if self.generated_prospects_log_file.exists():
+            self._compact_prospects_log()
     
     def _ensure_files_exist(self) -> None:
         """Ensure required JSON files exist with default structure."""
         if not self.org_webhooks_file.exists():
-            self._write_json_atomic(self.org_webhooks_file, [])
+            json_io.write_json_atomic(self.org_webhooks_file, [])
         
         if not self.generated_prospects_file.exists():
-            self._write_json_atomic(self.generated_prospects_file, {})
-    
-    def _write_json_atomic(self, file_path: Path, data: Any) -> None:
-        """Write JSON data atomically to prevent corruption."""
-        with tempfile.NamedTemporaryFile(
-            mode='w', 
-            dir=file_path.parent, 
-            delete=False,
-            suffix='.tmp'
-        ) as temp_file:
-            json.dump(data, temp_file, indent=2)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-        
-        # Atomic rename - handle Windows file exists issue
-        try:
-            os.rename(temp_file.name, file_path)
-        except OSError:
-            # On Windows, remove existing file before rename
-            if file_path.exists():
-                file_path.unlink()
-            os.rename(temp_file.name, file_path)
+            json_io.write_json_atomic(self.generated_prospects_file, {})
     
     def get_organizations(self) -> List[Organization]:
-        """Load organizations from JSON and parse into Pydantic models."""
+        """Load organizations from JSON and parse into model objects."""
         try:
-            with open(self.org_webhooks_file, 'r') as f:
-                data = json.load(f)
+            with self._organizations_lock:
+                data = self._load_organizations_data()
             
             # Handle legacy format where orgs are wrapped in "organizations" key
             if isinstance(data, dict) and "organizations" in data:
@@ -65,8 +68,9 @@ class DataService:
                 if not isinstance(org_data, dict):
                     continue
                     
-                # Parse webhooks
-                webhooks = [Webhook(**webhook) for webhook in org_data.get('webhooks', [])]
+                # Parse webhooks; this file is written by us, so construct directly
+                # from the known keys (ignoring any extra legacy keys)
+                webhooks = [Webhook(name=webhook['name'], url=webhook['url']) for webhook in org_data.get('webhooks', [])]
                 
                 # Create organization with parsed webhooks
                 # Handle missing owner_id for legacy data
@@ -79,11 +83,30 @@ class DataService:
                 organizations.append(org)
             
             return organizations
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        except (FileNotFoundError, json_io.JSONDecodeError, KeyError):
             return []
     
+    def _load_organizations_data(self) -> Any:
+        """Return the parsed organizations file, re-reading it only if it changed. Call with the lock held."""
+        if self._organizations_dirty:
+            return self._organizations_data
+        
+        stat = os.stat(self.org_webhooks_file)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key != self._organizations_stat:
+            self._organizations_data = json_io.read_json(self.org_webhooks_file)
+            self._organizations_stat = stat_key
+        return self._organizations_data
+    
     def save_organizations(self, organizations: List[Organization]) -> None:
-        """Save organizations to JSON file."""
+        """
+        Save organizations to JSON file.
+        
+        The write is debounced: it happens ORGANIZATIONS_FLUSH_DELAY seconds
+        after the last save, so a burst of edits is written once. Until then
+        get_organizations returns the saved data. Call flush_organizations to
+        write immediately (e.g. on shutdown).
+        """
         data = []
         for org in organizations:
             org_dict = {
@@ -94,36 +117,129 @@ class DataService:
             }
             data.append(org_dict)
         
-        self._write_json_atomic(self.org_webhooks_file, data)
+        with self._organizations_lock:
+            self._organizations_data = data
+            self._organizations_dirty = True
+            if self._organizations_flush_timer is not None:
+                self._organizations_flush_timer.cancel()
+            # Not a daemon thread, so a pending write still happens at interpreter exit
+            self._organizations_flush_timer = threading.Timer(self.ORGANIZATIONS_FLUSH_DELAY, self._flush_organizations_in_background)
+            self._organizations_flush_timer.start()
+    
+    def _flush_organizations_in_background(self) -> None:
+        """Timer callback for flush_organizations; a failed write is reported and retried later."""
+        try:
+            self.flush_organizations()
+        except OSError as e:
+            # The data stays dirty, so the next save or the shutdown flush writes it
+            print(f"Warning: Failed to write organizations to {self.org_webhooks_file}: {e}")
+    
+    def flush_organizations(self) -> None:
+        """
+        Write any organizations saved since the last write.
+        
+        Raises:
+            OSError: If the file cannot be written; the changes stay pending
+        """
+        with self._organizations_lock:
+            if self._organizations_flush_timer is not None:
+                self._organizations_flush_timer.cancel()
+                self._organizations_flush_timer = None
+            
+            if not self._organizations_dirty:
+                return
+            
+            json_io.write_json_atomic(self.org_webhooks_file, self._organizations_data)
+            stat = os.stat(self.org_webhooks_file)
+            self._organizations_stat = (stat.st_mtime_ns, stat.st_size)
+            self._organizations_dirty = False
     
     def get_generated_prospects_data(self) -> GeneratedProspectsData:
         """Load generated prospects data from JSON."""
         try:
-            with open(self.generated_prospects_file, 'r') as f:
-                data = json.load(f)
+            data = json_io.read_json(self.generated_prospects_file)
             
-            # Parse into Pydantic model
-            prospects_data = GeneratedProspectsData(data={})
-            for org_id, org_prospects_data in data.items():
-                prospects_data.data[org_id] = OrganizationProspects(
+            # Parse into model objects straight from the known keys
+            prospects_data = GeneratedProspectsData(data={
+                org_id: OrganizationProspects(
                     next_prospect_index=org_prospects_data.get('next_prospect_index', 1),
                     prospects=[
-                        {
-                            'firstName': prospect['firstName'],
-                            'lastName': prospect['lastName'],
-                            'email': prospect['email'],
-                            'phone': prospect['phone']
-                        }
+                        Prospect(
+                            firstName=prospect['firstName'],
+                            lastName=prospect['lastName'],
+                            email=prospect['email'],
+                            phone=prospect['phone']
+                        )
                         for prospect in org_prospects_data.get('prospects', [])
                     ]
                 )
+                for org_id, org_prospects_data in data.items()
+            })
+        except (FileNotFoundError, json_io.JSONDecodeError):
+            prospects_data = GeneratedProspectsData(data={})
+        
+        self._replay_prospects_log(prospects_data)
+        return prospects_data
+    
+    def _replay_prospects_log(self, prospects_data: GeneratedProspectsData) -> None:
+        """Apply prospects appended since the last snapshot."""
+        try:
+            with open(self.generated_prospects_log_file, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        
+        for line in lines:
+            try:
+                entry = json_io.loads(line)
+                org_id = entry['org_id']
+                fields = entry['prospect']
+            except (KeyError, TypeError, ValueError):
+                # Skip a torn line (JSONDecodeError is a ValueError) or one
+                # that isn't an object with both keys
+                continue
             
-            return prospects_data
-        except (FileNotFoundError, json.JSONDecodeError):
-            return GeneratedProspectsData(data={})
+            # Prospect is a plain dataclass and doesn't validate its fields, so
+            # check the types here rather than loading bad data into the state
+            if not isinstance(org_id, str) or not isinstance(fields, dict):
+                continue
+            if fields.keys() != _PROSPECT_FIELDS or not all(isinstance(value, str) for value in fields.values()):
+                continue
+            
+            prospect = Prospect(**fields)
+            org_prospects = prospects_data.get_org_prospects(org_id)
+            org_prospects.prospects.append(prospect)
+            org_prospects.next_prospect_index += 1
+    
+    def append_prospect(self, org_id: str, prospect: Prospect) -> None:
+        """
+        Record a newly saved prospect and advance the organization's prospect index.
+        
+        Only one line is appended to the prospects log rather than rewriting the
+        whole snapshot; the log is compacted every PROSPECTS_LOG_COMPACT_EVERY appends.
+        """
+        entry = {
+            'org_id': org_id,
+            'prospect': {
+                'firstName': prospect.firstName,
+                'lastName': prospect.lastName,
+                'email': prospect.email,
+                'phone': prospect.phone
+            }
+        }
+        with open(self.generated_prospects_log_file, 'ab') as f:
+            f.write(json_io.dumps(entry) + b"\n")
+        
+        self._prospects_log_appends += 1
+        if self._prospects_log_appends >= self.PROSPECTS_LOG_COMPACT_EVERY:
+            self._compact_prospects_log()
+    
+    def _compact_prospects_log(self) -> None:
+        """Fold the prospects log into the snapshot file."""
+        self.save_generated_prospects_data(self.get_generated_prospects_data())
     
     def save_generated_prospects_data(self, prospects_data: GeneratedProspectsData) -> None:
-        """Save generated prospects data to JSON file."""
+        """Save generated prospects data to JSON file, replacing any appended log entries."""
         data = {}
         for org_id, org_prospects in prospects_data.data.items():
             data[org_id] = {
@@ -139,4 +255,10 @@ class DataService:
                 ]
             }
         
-        self._write_json_atomic(self.generated_prospects_file, data)
\ No newline at end of file
+        # Generated prospects are test data that can be regenerated, so skip the fsync
+        json_io.write_json_atomic(self.generated_prospects_file, data, durable=False)
+        
+        # The snapshot now includes everything in the log
+        if self.generated_prospects_log_file.exists():
+            self.generated_prospects_log_file.unlink()
+        self._prospects_log_appends = 0
\ No newline at end of file
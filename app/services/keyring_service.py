@@ -1,18 +1,29 @@
 import keyring
-from typing import Optional
+from typing import Optional, Union
+
+
+# Marks the cached password as not yet read from the keyring
+_UNSET = object()
 
 
 class KeyringService:
     SERVICE_NAME = "BonzoBuddy"
     ADMIN_PASSWORD_KEY = "admin_password"
     
+    def __init__(self):
+        # In-process copy of the admin password so repeat lookups skip the OS keyring
+        self._cached_admin_password: Union[Optional[str], object] = _UNSET
+    
     def set_admin_password(self, password: str) -> None:
         """Store the global admin password for Bonzo platform impersonation."""
         keyring.set_password(self.SERVICE_NAME, self.ADMIN_PASSWORD_KEY, password)
+        self._cached_admin_password = password
     
     def get_admin_password(self) -> Optional[str]:
         """Retrieve the global admin password."""
-        return keyring.get_password(self.SERVICE_NAME, self.ADMIN_PASSWORD_KEY)
+        if self._cached_admin_password is _UNSET:
+            self._cached_admin_password = keyring.get_password(self.SERVICE_NAME, self.ADMIN_PASSWORD_KEY)
+        return self._cached_admin_password
     
     def delete_admin_password(self) -> None:
         """Delete the stored admin password."""
@@ -21,6 +32,7 @@ class KeyringService:
         except keyring.errors.PasswordDeleteError:
             # Password doesn't exist, which is fine
             pass
+        self._cached_admin_password = None
     
     def has_admin_password(self) -> bool:
         """Check if admin password is set."""
@@ -1,8 +1,19 @@
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from .. import json_io
 from ..models.core import Prospect
 from ..services.schema_registry import SchemaRegistry
 
 
+# Schema type for each static value type when converting payloads back to schemas
+_PAYLOAD_SCHEMA_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+}
+
+
 class PayloadService:
     """
     Modern payload generation service using Pydantic schema models.
@@ -11,8 +22,17 @@ class PayloadService:
     clean, type-safe approach using the SchemaRegistry.
     """
     
+    # Maximum number of generated payloads kept in the LRU cache
+    PAYLOAD_CACHE_SIZE = 128
+    
     def __init__(self, schemas_path: str = "schemas"):
         self.schema_registry = SchemaRegistry(schemas_path)
+        
+        # Generated payloads keyed by (webhook_name, profile, prospect values)
+        self._payload_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        
+        # Category -> integrations mapping, built on first use and cleared on reload
+        self._categories_and_integrations: Optional[Dict[str, List[str]]] = None
     
     def get_integration_profiles(self, webhook_name: str) -> List[str]:
         """
@@ -44,16 +64,27 @@ class PayloadService:
             
         Raises:
             ValueError: If webhook/integration cannot be resolved or schema not found
+            
+        Note:
+            Payloads are cached, so the returned dictionary is shared and
+            must not be mutated by callers.
         """
-        # Convert prospect to dictionary for schema processing
-        prospect_data = {
-            "firstName": prospect.firstName,
-            "lastName": prospect.lastName,
-            "email": prospect.email,
-            "phone": prospect.phone
-        }
-        
-        return self.schema_registry.generate_payload(webhook_name, prospect_data, profile)
+        # Prospect values in DYNAMIC_FIELD_ORDER, read by index in compiled schemas
+        prospect_values = (prospect.firstName, prospect.lastName, prospect.email, prospect.phone)
+        cache_key = (webhook_name, profile, prospect_values)
+        cache = self._payload_cache
+        
+        payload = cache.get(cache_key)
+        if payload is not None:
+            cache.move_to_end(cache_key)
+            return payload
+        
+        payload = self.schema_registry.generate_payload_from_values(webhook_name, prospect_values, profile)
+        
+        cache[cache_key] = payload
+        if len(cache) > self.PAYLOAD_CACHE_SIZE:
+            cache.popitem(last=False)
+        return payload
     
     def save_custom_schema(self, webhook_name: str, schema_name: str, payload: Dict[str, Any]) -> None:
         """
@@ -72,17 +103,7 @@ class PayloadService:
             raise ValueError(f"Cannot resolve integration from webhook name: {webhook_name}")
         
         # Find the integration's category
-        schema_info_by_category = self.schema_registry.get_schema_info_by_category()
-        integration_category = None
-        
-        for category, schema_infos in schema_info_by_category.items():
-            for schema_info in schema_infos:
-                if schema_info.integration == integration:
-                    integration_category = category
-                    break
-            if integration_category:
-                break
-        
+        integration_category = self.schema_registry.get_category_for_integration(integration)
         if not integration_category:
             raise ValueError(f"Cannot determine category for integration: {integration}")
         
@@ -96,9 +117,7 @@ class PayloadService:
         # Save the custom schema
         schema_file = custom_schemas_path / f"{schema_name.lower().replace(' ', '_')}_schema.json"
         
-        import json
-        with open(schema_file, 'w') as f:
-            json.dump(schema_data, f, indent=2)
+        json_io.write_json_atomic(schema_file, schema_data, durable=False)
     
     def _payload_to_schema(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -117,24 +136,13 @@ class PayloadService:
                     "type": "object",
                     "properties": self._payload_to_schema(value)
                 }
-            elif isinstance(value, str):
-                schema[key] = {
-                    "type": "string",
-                    "static": value
-                }
-            elif isinstance(value, int):
-                schema[key] = {
-                    "type": "integer", 
-                    "static": value
-                }
-            elif isinstance(value, float):
-                schema[key] = {
-                    "type": "number",
-                    "static": value
-                }
-            elif isinstance(value, bool):
+                continue
+            
+            # Exact type lookup, so bool is not mistaken for int
+            schema_type = _PAYLOAD_SCHEMA_TYPES.get(type(value))
+            if schema_type is not None:
                 schema[key] = {
-                    "type": "boolean",
+                    "type": schema_type,
                     "static": value
                 }
             else:
@@ -152,12 +160,21 @@ class PayloadService:
         
         Returns:
             Dictionary mapping category names to lists of integration names
+            
+        Note:
+            The mapping is cached until reload_schemas(), so the returned
+            dictionary is shared and must not be mutated by callers.
         """
-        result = {}
-        for category in self.schema_registry.get_categories():
-            result[category] = self.schema_registry.get_integrations_for_category(category)
+        result = self._categories_and_integrations
+        if result is None:
+            result = {}
+            for category in self.schema_registry.get_categories():
+                result[category] = self.schema_registry.get_integrations_for_category(category)
+            self._categories_and_integrations = result
         return result
     
     def reload_schemas(self) -> None:
-        """Reload all schemas from the filesystem."""
-        self.schema_registry = SchemaRegistry(str(self.schema_registry.schemas_path))
\ No newline at end of file
+        """Reload schemas from the filesystem, re-parsing only changed files."""
+        self.schema_registry.reload()
+        self._payload_cache.clear()
+        self._categories_and_integrations = None
\ No newline at end of file
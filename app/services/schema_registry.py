@@ -1,8 +1,11 @@
 import os
+import sys
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 from ..models.schemas import IntegrationSchema, SchemaInfo
 
@@ -15,99 +18,238 @@ class SchemaRegistry:
     schemas dynamically from the filesystem structure.
     """
     
+    # Integrations with at least this many schema files to parse are parsed in a thread pool
+    PARALLEL_PARSE_MIN_FILES = 4
+    PARALLEL_PARSE_MAX_WORKERS = 8
+    
     def __init__(self, schemas_path: str = "schemas"):
         self.schemas_path = Path(schemas_path)
         
         # Registry storage
-        self._schemas: Dict[str, Dict[str, IntegrationSchema]] = defaultdict(dict)
+        # Parsed schemas by integration, then profile (None for the unprofiled
+        # schema); filled per integration on first use
+        self._schemas: Dict[str, Dict[Optional[str], IntegrationSchema]] = {}
         self._schema_info: List[SchemaInfo] = []
         self._categories: Dict[str, List[str]] = defaultdict(list)
+        # Category of each integration that has schema files (first category wins)
+        self._integration_to_category: Dict[str, str] = {}
+        
+        # Every parsed schema by file path with the mtime it was parsed at,
+        # so reloads only re-parse files that changed
+        self._parsed_files: Dict[str, Tuple[int, IntegrationSchema]] = {}
+        
+        # Lookup indexes derived from the discovered schemas (see _build_indexes)
+        self._all_integrations: Tuple[str, ...] = ()
+        self._integration_by_lower: Dict[str, str] = {}
+        self._schema_info_by_integration: Dict[str, List[SchemaInfo]] = {}
+        self._schema_info_by_category: Dict[str, List[SchemaInfo]] = {}
+        self._profiles_by_integration: Dict[str, Tuple[str, ...]] = {}
+        self._resolve_cache: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
         
-        # Load all schemas
+        # Index all schema files (parsing is deferred)
         self._discover_schemas()
+        self._build_indexes()
+    
+    def reload(self) -> None:
+        """
+        Re-scan the schemas directory, keeping parsed schemas for unchanged files.
+        
+        Added and modified files are parsed on next use; removed files are dropped.
+        Unchanged schemas keep their compiled payload functions.
+        """
+        self._schemas = {}
+        self._schema_info = []
+        self._categories = defaultdict(list)
+        self._integration_to_category = {}
+        self._discover_schemas()
+        self._build_indexes()
+        
+        known_paths = {info.file_path for info in self._schema_info}
+        self._parsed_files = {
+            path: parsed for path, parsed in self._parsed_files.items() if path in known_paths
+        }
     
     def _discover_schemas(self) -> None:
         """
         Discover all schemas by scanning the filesystem.
         
         Follows the structure: schemas/{category}/{integration}/*_schema.json
+        
+        Only the lightweight SchemaInfo index is built here; schema files are
+        parsed on first use by _load_integration. Category, integration and
+        profile names are interned, as they are a small, heavily reused
+        vocabulary of dict keys.
         """
         if not self.schemas_path.exists():
             print(f"Warning: Schemas path {self.schemas_path} does not exist")
             return
         
-        # Scan categories (top-level directories)
-        for category_path in self.schemas_path.iterdir():
-            if not category_path.is_dir() or category_path.name.startswith('.'):
-                continue
-            
-            category = category_path.name
-            
-            # Scan integrations (second-level directories)
-            for integration_path in category_path.iterdir():
-                if not integration_path.is_dir() or integration_path.name.startswith('.'):
+        # Scan categories (top-level directories); DirEntry reuses the type
+        # from readdir so no extra stat is needed per entry
+        with os.scandir(self.schemas_path) as category_entries:
+            for category_entry in category_entries:
+                if category_entry.name.startswith('.') or not category_entry.is_dir(follow_symlinks=False):
                     continue
                 
-                integration = integration_path.name
-                self._categories[category].append(integration)
+                category = sys.intern(category_entry.name)
                 
-                # Find all schema files in this integration
-                schema_files = list(integration_path.glob("*_schema.json"))
-                
-                for schema_file in schema_files:
-                    try:
-                        # Extract profile from filename
-                        profile = self._extract_profile(schema_file.stem, integration)
-                        
-                        # Create schema info
-                        schema_info = SchemaInfo(
-                            category=category,
-                            integration=integration,
-                            profile=profile,
-                            file_path=str(schema_file)
-                        )
-                        self._schema_info.append(schema_info)
+                # Scan integrations (second-level directories)
+                with os.scandir(category_entry.path) as integration_entries:
+                    for integration_entry in integration_entries:
+                        if integration_entry.name.startswith('.') or not integration_entry.is_dir(follow_symlinks=False):
+                            continue
                         
-                        # Load the actual schema
-                        schema = IntegrationSchema.from_json_file(
-                            str(schema_file),
-                            category=category,
-                            integration=integration,
-                            profile=profile
-                        )
+                        integration = sys.intern(integration_entry.name)
+                        integration_prefix = integration.lower() + "_"
+                        self._categories[category].append(integration)
                         
-                        # Store in registry
-                        schema_key = f"{integration}_{profile}" if profile else integration
-                        self._schemas[integration][schema_key] = schema
-                        
-                    except Exception as e:
-                        print(f"Warning: Failed to load schema {schema_file}: {e}")
+                        # Find all schema files in this integration
+                        with os.scandir(integration_entry.path) as file_entries:
+                            for file_entry in file_entries:
+                                if not file_entry.name.endswith("_schema.json") or not file_entry.is_file():
+                                    continue
+                                
+                                # Extract profile from filename
+                                profile = self._extract_profile(file_entry.name[:-len(".json")], integration_prefix)
+                                if profile:
+                                    profile = sys.intern(profile)
+                                
+                                # Create schema info
+                                schema_info = SchemaInfo(
+                                    category=category,
+                                    integration=integration,
+                                    profile=profile,
+                                    file_path=file_entry.path
+                                )
+                                self._schema_info.append(schema_info)
+                                self._integration_to_category.setdefault(integration, category)
+    
+    def _build_indexes(self) -> None:
+        """Build lookup indexes once discovery has finished."""
+        self._all_integrations = tuple(sorted(set(chain.from_iterable(self._categories.values()))))
+        
+        # Case-insensitive integration names; the first in sorted order wins on collisions
+        self._integration_by_lower = {}
+        for integration in self._all_integrations:
+            self._integration_by_lower.setdefault(integration.lower(), integration)
+        
+        # Schema files per integration and per category, in discovery order
+        self._schema_info_by_integration = {}
+        self._schema_info_by_category = {}
+        for schema_info in self._schema_info:
+            self._schema_info_by_integration.setdefault(schema_info.integration, []).append(schema_info)
+            self._schema_info_by_category.setdefault(schema_info.category, []).append(schema_info)
+        
+        # Sorted profile names per integration ("default" for unprofiled schemas)
+        self._profiles_by_integration = {}
+        for integration, schema_infos in self._schema_info_by_integration.items():
+            profiles = {schema_info.profile for schema_info in schema_infos}
+            self._profiles_by_integration[integration] = tuple(sorted(profile or "default" for profile in profiles))
+        
+        self._resolve_cache = {}
+    
+    def _load_integration(self, integration: str) -> Optional[Dict[Optional[str], IntegrationSchema]]:
+        """
+        Parse and cache all schemas for an integration on first use.
+        
+        Returns:
+            Mapping of profile (None if unprofiled) to IntegrationSchema, or None if the
+            integration has no schema files
+        """
+        schemas = self._schemas.get(integration)
+        if schemas is not None:
+            return schemas
+        
+        schema_infos = self._schema_info_by_integration.get(integration)
+        if not schema_infos:
+            return None
+        
+        # Reuse parsed schemas for files that haven't changed since
+        loaded: Dict[str, IntegrationSchema] = {}
+        to_parse: List[Tuple[SchemaInfo, int]] = []
+        for schema_info in schema_infos:
+            try:
+                mtime = os.stat(schema_info.file_path).st_mtime_ns
+            except OSError as e:
+                print(f"Warning: Failed to load schema {schema_info.file_path}: {e}")
+                continue
+            
+            parsed = self._parsed_files.get(schema_info.file_path)
+            if parsed is not None and parsed[0] == mtime:
+                loaded[schema_info.file_path] = parsed[1]
+            else:
+                to_parse.append((schema_info, mtime))
+        
+        # Load the actual schemas
+        for (schema_info, mtime), result in zip(to_parse, self._parse_schema_files([info for info, _ in to_parse])):
+            if isinstance(result, Exception):
+                print(f"Warning: Failed to load schema {schema_info.file_path}: {result}")
+                continue
+            self._parsed_files[schema_info.file_path] = (mtime, result)
+            loaded[schema_info.file_path] = result
+        
+        # Store in registry, in discovery order
+        schemas = {}
+        for schema_info in schema_infos:
+            schema = loaded.get(schema_info.file_path)
+            if schema is None:
+                continue
+            schemas[schema_info.profile] = schema
+        
+        self._schemas[integration] = schemas
+        return schemas
     
-    def _extract_profile(self, filename_stem: str, integration: str) -> Optional[str]:
+    def _parse_schema_files(self, schema_infos: List[SchemaInfo]) -> List[Union[IntegrationSchema, Exception]]:
+        """
+        Parse schema files, in a thread pool when there are enough of them.
+        
+        Returns the parsed schema or the load error for each file, in order.
+        """
+        if len(schema_infos) < self.PARALLEL_PARSE_MIN_FILES:
+            return [self._parse_schema_file(schema_info) for schema_info in schema_infos]
+        
+        max_workers = min(self.PARALLEL_PARSE_MAX_WORKERS, os.cpu_count() or 1, len(schema_infos))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._parse_schema_file, schema_infos))
+    
+    @staticmethod
+    def _parse_schema_file(schema_info: SchemaInfo) -> Union[IntegrationSchema, Exception]:
+        """Parse one schema file, returning the error instead of raising it."""
+        try:
+            return IntegrationSchema.from_json_file(
+                schema_info.file_path,
+                category=schema_info.category,
+                integration=schema_info.integration,
+                profile=schema_info.profile
+            )
+        except (OSError, ValueError) as e:
+            # Unreadable file, invalid JSON, a malformed schema shape or a field
+            # failing validation (JSONDecodeError and pydantic's ValidationError
+            # are ValueErrors)
+            return e
+    
+    def _extract_profile(self, filename_stem: str, integration_prefix: str) -> Optional[str]:
         """
         Extract profile name from schema filename.
         
+        integration_prefix is the lowercased "{integration}_", computed once
+        per integration directory by the caller.
+        
         Examples:
         - zillow_simple_schema -> "simple"
         - mmi_mortgage_schema -> "mortgage"  
         - hubspot_schema -> None (single schema)
         """
-        # Remove the integration prefix if present
-        integration_lower = integration.lower()
-        if filename_stem.lower().startswith(integration_lower + "_"):
-            remaining = filename_stem[len(integration_lower) + 1:]
-            
-            # Remove _schema suffix if present
-            if remaining.endswith("_schema"):
-                remaining = remaining[:-7]
-            
-            return remaining if remaining else None
+        stem_lower = filename_stem.lower()
+        
+        # Remove the integration prefix if present, then the _schema suffix
+        if stem_lower.startswith(integration_prefix):
+            remaining = filename_stem[len(integration_prefix):].removesuffix("_schema")
+            return remaining or None
         
         # Check if it ends with _schema and remove it
-        if filename_stem.endswith("_schema"):
-            base_name = filename_stem[:-7]
-            if base_name.lower() != integration_lower:
-                return base_name
+        if filename_stem.endswith("_schema") and stem_lower[:-7] != integration_prefix[:-1]:
+            return filename_stem[:-7]
         
         return None
     
@@ -115,16 +257,17 @@ class SchemaRegistry:
         """Get all available categories."""
         return list(self._categories.keys())
     
+    def get_category_for_integration(self, integration: str) -> Optional[str]:
+        """Get the category an integration's schemas live in, or None if it has none."""
+        return self._integration_to_category.get(integration)
+    
     def get_integrations_for_category(self, category: str) -> List[str]:
         """Get all integrations in a category."""
         return self._categories.get(category, [])
     
     def get_all_integrations(self) -> List[str]:
         """Get all available integrations across all categories."""
-        integrations = set()
-        for category_integrations in self._categories.values():
-            integrations.update(category_integrations)
-        return sorted(integrations)
+        return list(self._all_integrations)
     
     def get_profiles_for_integration(self, integration: str) -> List[str]:
         """
@@ -132,18 +275,10 @@ class SchemaRegistry:
         
         Returns empty list if integration not found.
         Returns ["default"] if integration has only one schema.
-        """
-        if integration not in self._schemas:
-            return []
-        
-        profiles = []
-        for schema_key, schema in self._schemas[integration].items():
-            if schema.profile:
-                profiles.append(schema.profile)
-            else:
-                profiles.append("default")
         
-        return sorted(profiles)
+        Answered from the discovery index, so no schema files are parsed.
+        """
+        return list(self._profiles_by_integration.get(integration, ()))
     
     def get_schema(self, integration: str, profile: Optional[str] = None) -> Optional[IntegrationSchema]:
         """
@@ -156,25 +291,22 @@ class SchemaRegistry:
         Returns:
             IntegrationSchema or None if not found
         """
-        if integration not in self._schemas:
+        schemas = self._load_integration(integration)
+        if schemas is None:
             return None
         
         # If no profile specified, try to get the default or any available
         if profile is None:
             # First try to find a schema without a profile
-            if integration in self._schemas[integration]:
-                return self._schemas[integration][integration]
+            schema = schemas.get(None)
+            if schema is not None:
+                return schema
             
             # If not found, get the first available schema
-            schemas = self._schemas[integration]
-            if schemas:
-                return next(iter(schemas.values()))
-            
-            return None
+            return next(iter(schemas.values()), None)
         
         # Look for specific profile
-        schema_key = f"{integration}_{profile}"
-        return self._schemas[integration].get(schema_key)
+        return schemas.get(profile)
     
     def resolve_webhook_name(self, webhook_name: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -189,26 +321,28 @@ class SchemaRegistry:
         Returns:
             (integration, profile) tuple or (None, None) if not resolvable
         """
+        resolved = self._resolve_cache.get(webhook_name)
+        if resolved is not None:
+            return resolved
+        
         # Handle the standard naming convention: "{Integration} for {Organization}"
-        if " for " in webhook_name:
-            integration_part = webhook_name.split(" for ")[0].strip()
-        else:
-            # Fallback for webhook names that don't follow convention
-            integration_part = webhook_name.strip()
+        # (names without " for " fall back to the whole name)
+        integration_part = webhook_name.split(" for ", 1)[0].strip()
         
         # Find matching integration (case-insensitive)
-        for integration in self.get_all_integrations():
-            if integration.lower() == integration_part.lower():
-                return integration, None
+        integration = self._integration_by_lower.get(integration_part.lower())
+        resolved = (integration, None) if integration else (None, None)
         
-        return None, None
+        self._resolve_cache[webhook_name] = resolved
+        return resolved
     
     def get_schema_info_by_category(self) -> Dict[str, List[SchemaInfo]]:
-        """Get schema info organized by category for UI purposes."""
-        result = defaultdict(list)
-        for schema_info in self._schema_info:
-            result[schema_info.category].append(schema_info)
-        return dict(result)
+        """
+        Get schema info organized by category for UI purposes.
+        
+        The mapping is built once per discovery and shared; treat it as read-only.
+        """
+        return self._schema_info_by_category
     
     def generate_payload(self, webhook_name: str, prospect_data: Dict[str, str], profile: Optional[str] = None) -> Dict[str, any]:
         """
@@ -225,6 +359,21 @@ class SchemaRegistry:
         Raises:
             ValueError: If webhook/integration cannot be resolved
         """
+        return self._resolve_schema(webhook_name, profile).generate_payload(prospect_data)
+    
+    def generate_payload_from_values(self, webhook_name: str, prospect_values: tuple, profile: Optional[str] = None) -> Dict[str, any]:
+        """
+        Generate a payload from prospect values ordered as DYNAMIC_FIELD_ORDER.
+        
+        Same as generate_payload, but skips building a prospect dictionary.
+        
+        Raises:
+            ValueError: If webhook/integration cannot be resolved
+        """
+        return self._resolve_schema(webhook_name, profile).generate_payload_from_values(prospect_values)
+    
+    def _resolve_schema(self, webhook_name: str, profile: Optional[str] = None) -> IntegrationSchema:
+        """Resolve the schema for a webhook name and optional profile override."""
         integration, resolved_profile = self.resolve_webhook_name(webhook_name)
         
         if not integration:
@@ -238,4 +387,4 @@ class SchemaRegistry:
             available_profiles = self.get_profiles_for_integration(integration)
             raise ValueError(f"No schema found for {integration} with profile {target_profile}. Available profiles: {available_profiles}")
         
-        return schema.generate_payload(prospect_data)
\ No newline at end of file
+        return schema
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable
+from .. import json_io
 from ..models.core import AppState, Organization, Prospect
 from ..services.data_service import DataService
 from ..services.keyring_service import KeyringService
@@ -12,16 +13,34 @@ class AppStateManager:
         self.keyring_service = KeyringService()
         self.payload_service = PayloadService(f"{base_path}/schemas")
         
-        # List of callbacks to notify when state changes
-        self._update_callbacks: List[Callable[[], None]] = []
+        # Callbacks to notify when state changes, keyed by registration token
+        self._update_callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_callback_token = 0
+        
+        # Bumped on every generate_payload, so the UI can tell a regeneration of
+        # an identical payload apart from an unrelated update
+        self.payload_revision = 0
+    
+    def add_update_callback(self, callback: Callable[[], None]) -> int:
+        """
+        Add a callback to be called when state is updated.
+        
+        Returns:
+            A token that can be passed to remove_update_callback
+        """
+        token = self._next_callback_token
+        self._next_callback_token += 1
+        self._update_callbacks[token] = callback
+        return token
     
-    def add_update_callback(self, callback: Callable[[], None]) -> None:
-        """Add a callback to be called when state is updated."""
-        self._update_callbacks.append(callback)
+    def remove_update_callback(self, token: int) -> None:
+        """Remove a callback registered with add_update_callback."""
+        self._update_callbacks.pop(token, None)
     
     def _notify_update(self) -> None:
         """Notify all registered callbacks that state has been updated."""
-        for callback in self._update_callbacks:
+        # Iterate a snapshot so callbacks can register or remove callbacks
+        for callback in list(self._update_callbacks.values()):
             callback()
     
     def load_initial_data(self) -> None:
@@ -33,34 +52,48 @@ class AppStateManager:
         """Get all organizations from data service."""
         return self.data_service.get_organizations()
     
+    @staticmethod
+    def _find_organization(organizations: List[Organization], org_id: str) -> Optional[Organization]:
+        """Return the first organization with the given id, or None."""
+        return next((org for org in organizations if org.id == org_id), None)
+    
+    def _reset_selection(self, **overrides) -> None:
+        """
+        Clear the webhook, prospect and payload selection in a single state swap.
+        
+        Keyword arguments override the reset values (e.g. the newly selected
+        organization or webhook index).
+        """
+        update = {
+            'selected_webhook_index': None,
+            'selected_prospect': None,
+            'pending_prospect': None,
+            'generated_payload': None,
+            'payload_editable': False,
+            'selected_profile': None,
+            'available_profiles': [],
+        }
+        update.update(overrides)
+        self.state = self.state.model_copy(update=update)
+    
     def select_organization(self, organization: Organization) -> None:
         """Select an organization and update UI state."""
-        self.state.selected_organization = organization
-        self.state.selected_webhook_index = None
-        self.state.selected_prospect = None
-        self.state.pending_prospect = None
-        self.state.generated_payload = None
-        self.state.payload_editable = False
-        self.state.selected_profile = None
-        self.state.available_profiles = []
+        self._reset_selection(selected_organization=organization)
         self._notify_update()
     
     def select_webhook(self, webhook_index: int) -> None:
         """Select a webhook and update UI state."""
-        if not self.state.selected_organization:
+        org = self.state.selected_organization
+        if not org:
             return
         
-        if 0 <= webhook_index < len(self.state.selected_organization.webhooks):
-            self.state.selected_webhook_index = webhook_index
-            self.state.selected_prospect = None
-            self.state.pending_prospect = None
-            self.state.generated_payload = None
-            self.state.payload_editable = False
-            self.state.selected_profile = None
-            
+        if 0 <= webhook_index < len(org.webhooks):
             # Load available profiles for this webhook
-            webhook = self.state.selected_organization.webhooks[webhook_index]
-            self.state.available_profiles = self.payload_service.get_integration_profiles(webhook.name)
+            webhook = org.webhooks[webhook_index]
+            self._reset_selection(
+                selected_webhook_index=webhook_index,
+                available_profiles=self.payload_service.get_integration_profiles(webhook.name)
+            )
             
             self._notify_update()
     
@@ -72,12 +105,13 @@ class AppStateManager:
     
     def generate_new_prospect(self) -> Prospect:
         """Generate a new prospect for the selected organization."""
-        if not self.state.selected_organization:
+        org = self.state.selected_organization
+        if not org:
             raise ValueError("No organization selected")
         
         # Get current prospects data
         prospects_data = self.data_service.get_generated_prospects_data()
-        org_prospects = prospects_data.get_org_prospects(self.state.selected_organization.id)
+        org_prospects = prospects_data.get_org_prospects(org.id)
         
         # Generate new prospect
         index = org_prospects.next_prospect_index
@@ -97,10 +131,12 @@ class AppStateManager:
     
     def generate_payload(self, prospect: Optional[Prospect] = None, profile: Optional[str] = None) -> str:
         """Generate payload for selected webhook and prospect."""
-        if not self.state.selected_organization or self.state.selected_webhook_index is None:
+        org = self.state.selected_organization
+        webhook_index = self.state.selected_webhook_index
+        if not org or webhook_index is None:
             raise ValueError("No organization or webhook selected")
         
-        webhook = self.state.selected_organization.webhooks[self.state.selected_webhook_index]
+        webhook = org.webhooks[webhook_index]
         target_prospect = prospect or self.state.selected_prospect or self.state.pending_prospect
         
         if not target_prospect:
@@ -108,10 +144,11 @@ class AppStateManager:
         
         # Generate payload
         payload_dict = self.payload_service.generate_payload(webhook.name, target_prospect, profile)
-        payload_json = json.dumps(payload_dict, indent=2)
+        payload_json = json_io.dumps(payload_dict, indent=True).decode('utf-8')
         
         self.state.generated_payload = payload_json
         self.state.selected_profile = profile
+        self.payload_revision += 1
         
         self._notify_update()
         return payload_json
@@ -128,19 +165,13 @@ class AppStateManager:
     
     def save_prospect_after_successful_send(self) -> None:
         """Save pending prospect after successful webhook send."""
-        if not self.state.pending_prospect or not self.state.selected_organization:
+        org = self.state.selected_organization
+        pending_prospect = self.state.pending_prospect
+        if not pending_prospect or not org:
             return
         
-        # Get current prospects data
-        prospects_data = self.data_service.get_generated_prospects_data()
-        org_prospects = prospects_data.get_org_prospects(self.state.selected_organization.id)
-        
-        # Add prospect to saved list
-        org_prospects.prospects.append(self.state.pending_prospect)
-        org_prospects.next_prospect_index += 1
-        
-        # Save to file
-        self.data_service.save_generated_prospects_data(prospects_data)
+        # Append prospect to the saved list (also advances the prospect index)
+        self.data_service.append_prospect(org.id, pending_prospect)
         
         # Clear pending prospect
         self.state.pending_prospect = None
@@ -151,9 +182,8 @@ class AppStateManager:
         organizations = self.get_organizations()
         
         # Check if org_id already exists
-        for org in organizations:
-            if org.id == org_id:
-                raise ValueError(f"Organization with ID '{org_id}' already exists")
+        if any(org.id == org_id for org in organizations):
+            raise ValueError(f"Organization with ID '{org_id}' already exists")
         
         new_org = Organization(id=org_id, name=name, owner_id=owner_id)
         organizations.append(new_org)
@@ -164,40 +194,40 @@ class AppStateManager:
     def update_organization(self, org_id: str, name: str, owner_id: str) -> None:
         """Update an existing organization."""
         organizations = self.get_organizations()
+        selected = self.state.selected_organization
         
-        for org in organizations:
-            if org.id == self.state.selected_organization.id:
-                org.id = org_id
-                org.name = name
-                org.owner_id = owner_id
-                break
+        org = self._find_organization(organizations, selected.id) if selected else None
+        if org:
+            org.id = org_id
+            org.name = name
+            org.owner_id = owner_id
         
         self.data_service.save_organizations(organizations)
         
         # Update selected organization
-        if self.state.selected_organization:
-            self.state.selected_organization.id = org_id
-            self.state.selected_organization.name = name
-            self.state.selected_organization.owner_id = owner_id
+        if selected:
+            selected.id = org_id
+            selected.name = name
+            selected.owner_id = owner_id
         
         self._notify_update()
     
     def add_webhook(self, name: str, url: str) -> None:
         """Add webhook to selected organization."""
-        if not self.state.selected_organization:
+        selected = self.state.selected_organization
+        if not selected:
             raise ValueError("No organization selected")
         
         organizations = self.get_organizations()
         
-        for org in organizations:
-            if org.id == self.state.selected_organization.id:
-                from ..models.core import Webhook
-                new_webhook = Webhook(name=name, url=url)
-                org.webhooks.append(new_webhook)
-                
-                # Update state as well
-                self.state.selected_organization.webhooks.append(new_webhook)
-                break
+        org = self._find_organization(organizations, selected.id)
+        if org:
+            from ..models.core import Webhook
+            new_webhook = Webhook(name=name, url=url)
+            org.webhooks.append(new_webhook)
+            
+            # Update state as well
+            selected.webhooks.append(new_webhook)
         
         self.data_service.save_organizations(organizations)
         self._notify_update()
@@ -210,15 +240,9 @@ class AppStateManager:
         organizations = [org for org in organizations if org.id != organization_id]
         
         # If the deleted organization was selected, clear all related state
-        if self.state.selected_organization and self.state.selected_organization.id == organization_id:
-            self.state.selected_organization = None
-            self.state.selected_webhook_index = None
-            self.state.selected_prospect = None
-            self.state.pending_prospect = None
-            self.state.generated_payload = None
-            self.state.payload_editable = False
-            self.state.selected_profile = None
-            self.state.available_profiles = []
+        selected = self.state.selected_organization
+        if selected and selected.id == organization_id:
+            self._reset_selection(selected_organization=None)
         
         # Clear any prospects associated with this organization
         prospects_data = self.data_service.get_generated_prospects_data()
@@ -231,41 +255,32 @@ class AppStateManager:
     
     def delete_webhook(self, webhook_index: int) -> None:
         """Delete webhook from selected organization."""
-        if not self.state.selected_organization:
+        selected = self.state.selected_organization
+        if not selected:
             return
         
-        if 0 <= webhook_index < len(self.state.selected_organization.webhooks):
+        if 0 <= webhook_index < len(selected.webhooks):
             organizations = self.get_organizations()
             
-            for org in organizations:
-                if org.id == self.state.selected_organization.id:
-                    del org.webhooks[webhook_index]
-                    del self.state.selected_organization.webhooks[webhook_index]
-                    break
+            org = self._find_organization(organizations, selected.id)
+            if org:
+                del org.webhooks[webhook_index]
+                del selected.webhooks[webhook_index]
             
             self.data_service.save_organizations(organizations)
             
             # Reset webhook selection if deleted webhook was selected
             if self.state.selected_webhook_index == webhook_index:
-                self.state.selected_webhook_index = None
-                self.state.selected_prospect = None
-                self.state.pending_prospect = None
-                self.state.generated_payload = None
-                self.state.payload_editable = False
-                self.state.selected_profile = None
-                self.state.available_profiles = []
+                self._reset_selection()
             
             self._notify_update()
     
     def get_existing_prospects(self) -> List[Prospect]:
         """Get existing prospects for selected organization."""
-        if not self.state.selected_organization:
+        org = self.state.selected_organization
+        if not org:
             return []
         
         prospects_data = self.data_service.get_generated_prospects_data()
-        org_prospects = prospects_data.get_org_prospects(self.state.selected_organization.id)
+        org_prospects = prospects_data.get_org_prospects(org.id)
         return org_prospects.prospects
-
-
-# Import json here to avoid circular imports
-import json
\ No newline at end of file
@@ -1,75 +1,104 @@
 import customtkinter as ctk
-import webbrowser
-import json
-import requests
+import threading
 import tkinter.messagebox as messagebox
-from typing import List, Optional
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type
 
+from .. import json_io
 from ..state.app_state import AppStateManager
 from ..models.core import Organization, Prospect
-from .popups import AddOrganizationPopup, EditOrganizationPopup, AddWebhookPopup, SetAdminPasswordPopup
+from .popups import ReusablePopup, AddOrganizationPopup, EditOrganizationPopup, AddWebhookPopup, SetAdminPasswordPopup
+from .theme import COLORS, get_font
+from .virtual_list import VirtualList
+
+if TYPE_CHECKING:
+    import requests
 
 
 # Set appearance
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+# Shared HTTP session so repeated sends reuse keep-alive connections and TLS sessions.
+# Created on first send so requests (and urllib3/ssl) load off the startup path.
+_SESSION: Optional['requests.Session'] = None
+_SESSION_LOCK = threading.Lock()
+
+# Payloads larger than the threshold are inserted into the viewer in chunks
+PAYLOAD_CHUNK_THRESHOLD = 64 * 1024
+PAYLOAD_CHUNK_SIZE = 16 * 1024
+
+# Delay before regenerating the payload after the profile selection changes
+PROFILE_REGEN_DELAY_MS = 150
+
+# Signature placeholder for UI sections that have not been rendered yet
+_UNRENDERED = object()
+
+
+def _get_session() -> 'requests.Session':
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
 
 class BonzoBuddyApp(ctk.CTk):
+    colors = COLORS
+    
     def __init__(self):
         super().__init__()
         
         # Initialize app state manager
         self.state_manager = AppStateManager()
-        self.state_manager.add_update_callback(self.update_ui)
+        self.state_manager.add_update_callback(self._queue_update)
+        
+        # UI refresh coalescing (see _queue_update and batched)
+        self._update_depth = 0
+        self._update_pending = False
+        self._update_scheduled = False
+        
+        # True while a payload is being sent on the worker thread
+        self._sending = False
+        
+        # Inputs each UI section was last rendered from (see _section_changed)
+        self._section_signatures: Dict[str, Any] = {}
+        
+        # Payload text currently in the viewer and idle callbacks still inserting it
+        self._last_payload_shown: Optional[str] = None
+        self._payload_insert_ids: List[str] = []
+        
+        # (payload text, parsed JSON) from the last custom schema save, see _parse_payload
+        self._parsed_payload: Optional[Tuple[str, Any]] = None
+        
+        # Options last passed to each button by _set_button
+        self._last_button_options: Dict[ctk.CTkButton, Dict[str, str]] = {}
+        
+        # Pending debounced payload regeneration for a profile change
+        self._profile_after_id: Optional[str] = None
+        
+        # Popups are built once and hidden on close, see _show_popup
+        self._popups: Dict[Type[ReusablePopup], ReusablePopup] = {}
         
         # Window setup
         self.title("Bonzo Buddy v2")
         self.geometry("1400x800")
         
-        # Fonts
-        self.title_font = ctk.CTkFont(size=20, weight="bold")
-        self.label_font = ctk.CTkFont(size=16, weight="bold")
-        self.button_font = ctk.CTkFont(size=15, weight="bold")
-        self.list_font = ctk.CTkFont(size=16)
-        self.mono_font = ctk.CTkFont(family="monospace", size=14)
-        
-        # Modern Color Scheme
-        self.colors = {
-            # Primary actions
-            "primary": "#4CAF50",      # Green for main actions
-            "primary_hover": "#45a049",
-            
-            # Secondary actions  
-            "secondary": "#2196F3",    # Blue for secondary actions
-            "secondary_hover": "#1976D2",
-            
-            # Warning/Delete actions
-            "warning": "#FF5722",      # Red-orange for delete/warning
-            "warning_hover": "#E64A19",
-            
-            # Bonzo brand colors
-            "bonzo": "#FF6B35",        # Bonzo orange
-            "bonzo_hover": "#E55A2B",
-            
-            # Special actions
-            "accent": "#9C27B0",       # Purple for special features
-            "accent_hover": "#7B1FA2",
-            
-            # Neutral actions
-            "neutral": "#607D8B",      # Blue-grey for neutral actions
-            "neutral_hover": "#546E7A",
-            
-            # Success
-            "success": "#4CAF50",
-            "success_hover": "#388E3C",
-            
-            # Selected state
-            "selected": "#1565C0",     # Darker blue for selected items
-            
-            # Frames
-            "frame_border": "#37474F"  # Dark grey for frame borders
-        }
+        # Fonts (shared, created once per process)
+        self.title_font = get_font(20, "bold")
+        self.label_font = get_font(16, "bold")
+        self.button_font = get_font(15, "bold")
+        self.list_font = get_font(16)
+        self.mono_font = get_font(14, family="monospace")
         
         # Create UI
         self.create_ui()
@@ -105,8 +134,8 @@ class BonzoBuddyApp(ctk.CTk):
         ).grid(row=0, column=0, padx=15, pady=15, sticky="w")
         
         # Organization list
-        self.org_list_frame = ctk.CTkScrollableFrame(self.org_frame)
-        self.org_list_frame.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
+        self.org_list = VirtualList(self.org_frame, font=self.list_font, selected_color=self.colors["selected"])
+        self.org_list.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
         
         # Buttons frame
         buttons_frame = ctk.CTkFrame(self.org_frame)
@@ -216,8 +245,8 @@ class BonzoBuddyApp(ctk.CTk):
         ).grid(row=0, column=0, padx=15, pady=15, sticky="w")
         
         # Webhooks section
-        self.webhook_list_frame = ctk.CTkScrollableFrame(self.webhook_frame)
-        self.webhook_list_frame.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
+        self.webhook_list = VirtualList(self.webhook_frame, font=self.list_font, selected_color=self.colors["selected"])
+        self.webhook_list.grid(row=1, column=0, padx=15, pady=15, sticky="nsew")
         
         # Webhook buttons
         webhook_buttons_frame = ctk.CTkFrame(self.webhook_frame)
@@ -250,8 +279,25 @@ class BonzoBuddyApp(ctk.CTk):
         self.delete_webhook_btn.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         
         # Existing prospects section
-        self.prospects_list_frame = ctk.CTkScrollableFrame(self.webhook_frame)
-        self.prospects_list_frame.grid(row=3, column=0, padx=15, pady=15, sticky="nsew")
+        self.prospects_frame = ctk.CTkFrame(self.webhook_frame)
+        self.prospects_frame.grid(row=3, column=0, padx=15, pady=15, sticky="nsew")
+        self.prospects_frame.grid_columnconfigure(0, weight=1)
+        self.prospects_frame.grid_rowconfigure(1, weight=1)
+        
+        self.prospects_label = ctk.CTkLabel(
+            self.prospects_frame,
+            text="Existing Prospects:",
+            font=self.label_font
+        )
+        self.prospects_label.grid(row=0, column=0, padx=10, pady=(5, 0), sticky="w")
+        
+        self.prospects_list = VirtualList(
+            self.prospects_frame,
+            font=self.list_font,
+            selected_color=self.colors["selected"],
+            fg_color="transparent"
+        )
+        self.prospects_list.grid(row=1, column=0, sticky="nsew")
     
     def create_action_column(self) -> None:
         """Create the third column for payload generation and actions."""
@@ -367,6 +413,37 @@ class BonzoBuddyApp(ctk.CTk):
         # Initially hide custom save button
         self.save_custom_btn.grid_remove()
     
+    def _queue_update(self) -> None:
+        """
+        Request a UI refresh after a state change.
+        
+        Refreshes are coalesced: outside a batch one refresh is scheduled for
+        when Tk is idle, inside a batch it runs once when the batch exits.
+        """
+        self._update_pending = True
+        if self._update_depth == 0 and not self._update_scheduled:
+            self._update_scheduled = True
+            self.after_idle(self._flush_update)
+    
+    def _flush_update(self) -> None:
+        """Run a queued UI refresh, unless a batch already ran it."""
+        self._update_scheduled = False
+        if self._update_pending and self._update_depth == 0:
+            self._update_pending = False
+            self.update_ui()
+    
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Defer UI refreshes until the outermost batch exits, then refresh once."""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._update_pending:
+                self._update_pending = False
+                self.update_ui()
+    
     def update_ui(self) -> None:
         """Update UI based on current state."""
         self.populate_organization_list()
@@ -375,91 +452,96 @@ class BonzoBuddyApp(ctk.CTk):
         self.update_action_column()
         self.update_button_states()
     
+    def _section_changed(self, section: str, signature: Any) -> bool:
+        """Record the inputs a UI section renders from; False if unchanged since the last render."""
+        if self._section_signatures.get(section, _UNRENDERED) == signature:
+            return False
+        self._section_signatures[section] = signature
+        return True
+    
     def populate_organization_list(self) -> None:
         """Populate the organization list."""
-        # Clear existing widgets
-        for widget in self.org_list_frame.winfo_children():
-            widget.destroy()
-        
         organizations = self.state_manager.get_organizations()
+        selected_org = self.state_manager.state.selected_organization
+        
+        signature = (
+            tuple(
+                (org.id, org.name, org.owner_id, tuple((w.name, w.url) for w in org.webhooks))
+                for org in organizations
+            ),
+            selected_org.id if selected_org else None
+        )
+        if not self._section_changed("organizations", signature):
+            return
         
-        for i, org in enumerate(organizations):
-            is_selected = (self.state_manager.state.selected_organization and 
-                         org.id == self.state_manager.state.selected_organization.id)
-            
-            btn = ctk.CTkButton(
-                self.org_list_frame,
-                text=f"{org.name} ({org.id})",
-                command=lambda o=org: self.on_organization_selected(o),
-                font=self.list_font,
-                height=40,
-                fg_color=self.colors["selected"] if is_selected else None
+        self.org_list.set_rows([
+            (
+                f"{org.name} ({org.id})",
+                partial(self.on_organization_selected, org),
+                bool(selected_org and org.id == selected_org.id)
             )
-            btn.grid(row=i, column=0, padx=5, pady=5, sticky="ew")
-            self.org_list_frame.grid_columnconfigure(0, weight=1)
+            for org in organizations
+        ])
     
     def populate_webhook_list(self) -> None:
         """Populate the webhook list."""
-        # Clear existing widgets
-        for widget in self.webhook_list_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.state_manager.state.selected_organization:
+        state = self.state_manager.state
+        org = state.selected_organization
+        if not org:
+            if self._section_changed("webhooks", None):
+                self.webhook_list.set_rows([])
             return
         
-        webhooks = self.state_manager.state.selected_organization.webhooks
+        webhooks = org.webhooks
+        selected_index = state.selected_webhook_index
         
-        for i, webhook in enumerate(webhooks):
-            is_selected = self.state_manager.state.selected_webhook_index == i
-            
-            btn = ctk.CTkButton(
-                self.webhook_list_frame,
-                text=webhook.name,
-                command=lambda idx=i: self.on_webhook_selected(idx),
-                font=self.list_font,
-                height=40,
-                fg_color=self.colors["selected"] if is_selected else None
-            )
-            btn.grid(row=i, column=0, padx=5, pady=5, sticky="ew")
-            self.webhook_list_frame.grid_columnconfigure(0, weight=1)
+        signature = (tuple(webhook.name for webhook in webhooks), selected_index)
+        if not self._section_changed("webhooks", signature):
+            return
+        
+        self.webhook_list.set_rows([
+            (webhook.name, partial(self.on_webhook_selected, i), selected_index == i)
+            for i, webhook in enumerate(webhooks)
+        ])
     
     def populate_prospects_list(self) -> None:
         """Populate the existing prospects list."""
-        # Clear existing widgets
-        for widget in self.prospects_list_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.state_manager.state.selected_organization:
+        state = self.state_manager.state
+        if not state.selected_organization:
+            if self._section_changed("prospects", None):
+                self.prospects_label.grid_remove()
+                self.prospects_list.set_rows([])
             return
         
-        # Add label
-        ctk.CTkLabel(
-            self.prospects_list_frame,
-            text="Existing Prospects:",
-            font=self.label_font
-        ).grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        
         prospects = self.state_manager.get_existing_prospects()
+        selected_prospect = state.selected_prospect
         
-        for i, prospect in enumerate(prospects):
-            is_selected = (self.state_manager.state.selected_prospect and 
-                         prospect.email == self.state_manager.state.selected_prospect.email)
-            
-            btn = ctk.CTkButton(
-                self.prospects_list_frame,
-                text=f"{prospect.firstName} {prospect.lastName} ({prospect.email})",
-                command=lambda p=prospect: self.on_prospect_selected(p),
-                font=self.list_font,
-                height=40,
-                fg_color=self.colors["selected"] if is_selected else None
+        signature = (tuple(prospects), selected_prospect.email if selected_prospect else None)
+        if not self._section_changed("prospects", signature):
+            return
+        
+        self.prospects_label.grid()
+        self.prospects_list.set_rows([
+            (
+                f"{prospect.firstName} {prospect.lastName} ({prospect.email})",
+                partial(self.on_prospect_selected, prospect),
+                bool(selected_prospect and prospect.email == selected_prospect.email)
             )
-            btn.grid(row=i+1, column=0, padx=5, pady=5, sticky="ew")
-            self.prospects_list_frame.grid_columnconfigure(0, weight=1)
+            for prospect in prospects
+        ])
     
     def update_action_column(self) -> None:
         """Update the action column based on state."""
+        state = self.state_manager.state
+        profiles = state.available_profiles
+        payload = state.generated_payload
+        editable = state.payload_editable
+        
+        revision = self.state_manager.payload_revision
+        if not self._section_changed("action", (tuple(profiles), payload, editable, revision)):
+            return
+        
         # Update profile dropdown
-        profiles = self.state_manager.state.available_profiles
         if len(profiles) > 1:
             self.profile_dropdown.configure(values=profiles)
             self.profile_dropdown.configure(state="normal")
@@ -467,65 +549,105 @@ class BonzoBuddyApp(ctk.CTk):
         else:
             self.profile_frame.grid_remove()
         
-        # Update payload viewer
-        if self.state_manager.state.generated_payload:
+        # Update payload viewer; regenerating discards unsaved edits, as a new payload would
+        self._show_payload(payload)
+        if payload and editable:
             self.payload_viewer.configure(state="normal")
-            self.payload_viewer.delete("1.0", "end")
-            self.payload_viewer.insert("1.0", self.state_manager.state.generated_payload)
-            
-            if self.state_manager.state.payload_editable:
-                self.payload_viewer.configure(state="normal")
-                self.save_custom_btn.grid()
-            else:
-                self.payload_viewer.configure(state="disabled")
-                self.save_custom_btn.grid_remove()
+            self.save_custom_btn.grid()
         else:
-            self.payload_viewer.configure(state="normal")
-            self.payload_viewer.delete("1.0", "end")
             self.payload_viewer.configure(state="disabled")
             self.save_custom_btn.grid_remove()
     
+    def _show_payload(self, payload: Optional[str]) -> None:
+        """
+        Replace the payload viewer text, skipping the rewrite if it is already shown.
+        
+        Payloads over PAYLOAD_CHUNK_THRESHOLD are inserted in PAYLOAD_CHUNK_SIZE
+        pieces from idle callbacks so the Text widget never lays out the whole
+        buffer in one blocking call.
+        """
+        if payload == self._last_payload_shown and (
+            not self.state_manager.state.payload_editable
+            or self.payload_viewer.get("1.0", "end-1c") == payload
+        ):
+            # Already shown, and not since changed by the user in edit mode
+            return
+        
+        # Drop chunks still queued for a payload that is being replaced
+        for after_id in self._payload_insert_ids:
+            self.after_cancel(after_id)
+        self._payload_insert_ids.clear()
+        
+        self._last_payload_shown = payload
+        self.payload_viewer.configure(state="normal")
+        self.payload_viewer.delete("1.0", "end")
+        if not payload:
+            return
+        
+        if len(payload) <= PAYLOAD_CHUNK_THRESHOLD:
+            self.payload_viewer.insert("1.0", payload)
+            return
+        
+        for start in range(0, len(payload), PAYLOAD_CHUNK_SIZE):
+            chunk = payload[start:start + PAYLOAD_CHUNK_SIZE]
+            self._payload_insert_ids.append(self.after_idle(self._insert_payload_chunk, chunk))
+    
+    def _insert_payload_chunk(self, chunk: str) -> None:
+        """Append one chunk of a large payload, even if the viewer is read-only."""
+        state = self.payload_viewer.cget("state")
+        self.payload_viewer.configure(state="normal")
+        self.payload_viewer.insert("end-1c", chunk)
+        self.payload_viewer.configure(state=state)
+    
     def update_button_states(self) -> None:
         """Update button states based on current selections."""
-        has_org = self.state_manager.state.selected_organization is not None
-        has_webhook = self.state_manager.state.selected_webhook_index is not None
-        has_payload = self.state_manager.state.generated_payload is not None
-        has_prospect = (self.state_manager.state.selected_prospect is not None or 
-                       self.state_manager.state.pending_prospect is not None)
+        state = self.state_manager.state
+        has_org = state.selected_organization is not None
+        has_webhook = state.selected_webhook_index is not None
+        has_payload = state.generated_payload is not None
+        has_prospect = (state.selected_prospect is not None or 
+                       state.pending_prospect is not None)
         
         # Organization column buttons
-        self.edit_org_btn.configure(state="normal" if has_org else "disabled")
-        self.delete_org_btn.configure(state="normal" if has_org else "disabled")
-        self.open_team_btn.configure(state="normal" if has_org else "disabled")
-        self.open_owner_btn.configure(state="normal" if has_org else "disabled")
+        self._set_button(self.edit_org_btn, state="normal" if has_org else "disabled")
+        self._set_button(self.delete_org_btn, state="normal" if has_org else "disabled")
+        self._set_button(self.open_team_btn, state="normal" if has_org else "disabled")
+        self._set_button(self.open_owner_btn, state="normal" if has_org else "disabled")
         
         # Admin password buttons are always enabled (global scope)
-        self.set_password_btn.configure(state="normal")
-        self.copy_password_btn.configure(state="normal")
+        self._set_button(self.set_password_btn, state="normal")
+        self._set_button(self.copy_password_btn, state="normal")
         
         # Webhook column buttons
-        self.add_webhook_btn.configure(state="normal" if has_org else "disabled")
-        self.delete_webhook_btn.configure(state="normal" if has_webhook else "disabled")
+        self._set_button(self.add_webhook_btn, state="normal" if has_org else "disabled")
+        self._set_button(self.delete_webhook_btn, state="normal" if has_webhook else "disabled")
         
         # Action column buttons
-        self.generate_new_btn.configure(state="normal" if has_webhook else "disabled")
-        self.use_selected_btn.configure(state="normal" if (has_webhook and self.state_manager.state.selected_prospect) else "disabled")
-        self.edit_payload_btn.configure(state="normal" if has_payload else "disabled")
-        self.send_payload_btn.configure(state="normal" if has_payload else "disabled")
+        self._set_button(self.generate_new_btn, state="normal" if has_webhook else "disabled")
+        self._set_button(self.use_selected_btn, state="normal" if (has_webhook and state.selected_prospect) else "disabled")
+        self._set_button(self.edit_payload_btn, state="normal" if has_payload else "disabled")
+        self._set_button(self.send_payload_btn, state="normal" if has_payload and not self._sending else "disabled")
         
         # Update edit button text
-        if self.state_manager.state.payload_editable:
-            self.edit_payload_btn.configure(text="Save")
-        else:
-            self.edit_payload_btn.configure(text="Edit")
+        self._set_button(self.edit_payload_btn, text="Save" if state.payload_editable else "Edit")
+    
+    def _set_button(self, button: ctk.CTkButton, **options: str) -> None:
+        """Configure only the button options that differ from what was last set."""
+        last = self._last_button_options.setdefault(button, {})
+        changes = {name: value for name, value in options.items() if last.get(name) != value}
+        if changes:
+            button.configure(**changes)
+            last.update(changes)
     
     # Event handlers
     def on_organization_selected(self, organization: Organization) -> None:
         """Handle organization selection."""
+        self._cancel_profile_regen()
         self.state_manager.select_organization(organization)
     
     def on_webhook_selected(self, webhook_index: int) -> None:
         """Handle webhook selection."""
+        self._cancel_profile_regen()
         self.state_manager.select_webhook(webhook_index)
     
     def on_prospect_selected(self, prospect: Prospect) -> None:
@@ -533,34 +655,64 @@ class BonzoBuddyApp(ctk.CTk):
         self.state_manager.select_prospect(prospect)
     
     def on_profile_selected(self, profile: str) -> None:
-        """Handle profile selection."""
+        """Handle profile selection, regenerating once the selection settles."""
+        self._cancel_profile_regen()
+        self._profile_after_id = self.after(PROFILE_REGEN_DELAY_MS, self._do_regen, profile)
+    
+    def _cancel_profile_regen(self) -> None:
+        """Cancel a profile regeneration that has not run yet."""
+        if self._profile_after_id is not None:
+            self.after_cancel(self._profile_after_id)
+            self._profile_after_id = None
+    
+    def _do_regen(self, profile: str) -> None:
+        """Regenerate the payload for the selected profile."""
+        self._profile_after_id = None
+        
         # Regenerate payload with new profile if we have a prospect
         if (self.state_manager.state.selected_prospect or 
             self.state_manager.state.pending_prospect):
             prospect = (self.state_manager.state.selected_prospect or 
                        self.state_manager.state.pending_prospect)
             try:
-                self.state_manager.generate_payload(prospect, profile)
+                with self.batched():
+                    self.state_manager.generate_payload(prospect, profile)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to generate payload: {e}")
     
     # Action methods
-    def add_organization(self) -> None:
-        """Open add organization dialog."""
-        popup = AddOrganizationPopup(self, self.state_manager)
+    def _show_popup(self, popup_class: Type[ReusablePopup]) -> None:
+        """Show the popup of the given type, building it only on first use."""
+        popup = self._popups.get(popup_class)
+        if popup is None or not popup.winfo_exists():
+            popup = popup_class(self, self.state_manager)
+            # Grab input as soon as the window is actually visible, on every show
+            popup.bind("<Map>", partial(self._on_popup_mapped, popup), add="+")
+            self._popups[popup_class] = popup
+        else:
+            popup.reset()
+            popup.deiconify()
+        
         popup.transient(self)
         popup.focus_set()
-        self.after(100, popup.grab_set)  # Delayed grab_set to ensure window is visible
+    
+    @staticmethod
+    def _on_popup_mapped(popup: ReusablePopup, event) -> None:
+        """Set the popup's grab once its window is mapped."""
+        # Toplevel bindings also see <Map> events of the popup's child widgets
+        if event.widget is popup:
+            popup.grab_set()
+    
+    def add_organization(self) -> None:
+        """Open add organization dialog."""
+        self._show_popup(AddOrganizationPopup)
     
     def edit_organization(self) -> None:
         """Open edit organization dialog."""
         if not self.state_manager.state.selected_organization:
             return
         
-        popup = EditOrganizationPopup(self, self.state_manager)
-        popup.transient(self)
-        popup.focus_set()
-        self.after(100, popup.grab_set)  # Delayed grab_set to ensure window is visible
+        self._show_popup(EditOrganizationPopup)
     
     def delete_organization(self) -> None:
         """Delete selected organization with confirmation."""
@@ -589,6 +741,7 @@ class BonzoBuddyApp(ctk.CTk):
         
         org_id = self.state_manager.state.selected_organization.id
         url = f"https://platform.getbonzo.com/admin/teams/{org_id}/details"
+        import webbrowser
         webbrowser.open_new_tab(url)
     
     def open_owner_in_bonzo(self) -> None:
@@ -602,14 +755,12 @@ class BonzoBuddyApp(ctk.CTk):
             return
         
         url = f"https://platform.getbonzo.com/admin/users/{owner_id}?search=&role=&permission=&status=&tag=&active=&page=1&team_permission=&business_ids=&enterprise_id=&list_id=&per_page=50"
+        import webbrowser
         webbrowser.open_new_tab(url)
     
     def set_admin_password(self) -> None:
         """Open admin password dialog."""
-        popup = SetAdminPasswordPopup(self, self.state_manager)
-        popup.transient(self)
-        popup.focus_set()
-        self.after(100, popup.grab_set)  # Delayed grab_set to ensure window is visible
+        self._show_popup(SetAdminPasswordPopup)
     
     def copy_admin_password(self) -> None:
         """Copy admin password to clipboard."""
@@ -627,10 +778,7 @@ class BonzoBuddyApp(ctk.CTk):
         if not self.state_manager.state.selected_organization:
             return
         
-        popup = AddWebhookPopup(self, self.state_manager)
-        popup.transient(self)
-        popup.focus_set()
-        self.after(100, popup.grab_set)  # Delayed grab_set to ensure window is visible
+        self._show_popup(AddWebhookPopup)
     
     def delete_webhook(self) -> None:
         """Delete selected webhook."""
@@ -645,9 +793,11 @@ class BonzoBuddyApp(ctk.CTk):
     def generate_new_prospect(self) -> None:
         """Generate a new prospect and payload."""
         try:
-            prospect = self.state_manager.generate_new_prospect()
-            profile = self.state_manager.state.selected_profile
-            self.state_manager.generate_payload(prospect, profile)
+            # One UI refresh for the new prospect and its payload
+            with self.batched():
+                prospect = self.state_manager.generate_new_prospect()
+                profile = self.state_manager.state.selected_profile
+                self.state_manager.generate_payload(prospect, profile)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate prospect: {e}")
     
@@ -658,7 +808,8 @@ class BonzoBuddyApp(ctk.CTk):
         
         try:
             profile = self.state_manager.state.selected_profile
-            self.state_manager.generate_payload(self.state_manager.state.selected_prospect, profile)
+            with self.batched():
+                self.state_manager.generate_payload(self.state_manager.state.selected_prospect, profile)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate payload: {e}")
     
@@ -668,45 +819,66 @@ class BonzoBuddyApp(ctk.CTk):
             # Save changes
             current_text = self.payload_viewer.get("1.0", "end-1c")
             self.state_manager.update_payload(current_text)
+            # The viewer already shows the edited text; don't re-insert it
+            self._last_payload_shown = current_text
             self.state_manager.set_payload_editable(False)
         else:
             # Enable editing
             self.state_manager.set_payload_editable(True)
     
     def send_payload(self) -> None:
-        """Send payload to webhook."""
-        if (not self.state_manager.state.generated_payload or 
+        """Send payload to webhook on a worker thread so the UI stays responsive."""
+        if (self._sending or
+            not self.state_manager.state.generated_payload or 
             self.state_manager.state.selected_webhook_index is None):
             return
         
         webhook = self.state_manager.state.selected_organization.webhooks[self.state_manager.state.selected_webhook_index]
         payload_text = self.payload_viewer.get("1.0", "end-1c")
         
+        self._sending = True
+        self._set_button(self.send_payload_btn, state="disabled", text="Sending...")
+        threading.Thread(target=self._send_payload_worker, args=(webhook.url, payload_text), daemon=True).start()
+    
+    def _send_payload_worker(self, url: str, payload_text: str) -> None:
+        """Post the payload (worker thread) and hand the result back to the Tk thread."""
+        import requests
+        
         try:
             # Send raw text as JSON body (no validation)
-            response = requests.post(
-                webhook.url, 
+            response = _get_session().post(
+                url, 
                 data=payload_text,
                 headers={'Content-Type': 'application/json'},
                 timeout=30
             )
-            
-            # Show response (all status codes)
-            status_color = "green" if response.status_code == 200 else "red"
-            result_text = f"Status: {response.status_code}\nURL: {webhook.url}\nResponse: {response.text[:1000]}"
-            
-            # Show response in appropriate dialog based on status
-            if response.status_code == 200:
-                messagebox.showinfo("Send Result", result_text)
-                # If successful and we have a pending prospect, save it
-                if self.state_manager.state.pending_prospect:
-                    self.state_manager.save_prospect_after_successful_send()
-                    messagebox.showinfo("Success", "Prospect saved successfully!")
-            else:
-                messagebox.showwarning("Webhook Response", result_text)
-            
         except requests.RequestException as e:
-            messagebox.showerror("Error", f"Request failed: {e}")
+            self.after(0, self._on_send_done, url, None, e)
+        else:
+            self.after(0, self._on_send_done, url, response, None)
+    
+    def _on_send_done(self, url: str, response: Optional['requests.Response'], error: Optional[Exception]) -> None:
+        """Show the send result and save the pending prospect on success (Tk thread)."""
+        self._sending = False
+        self._set_button(self.send_payload_btn, text="Send Payload")
+        self.update_button_states()
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Request failed: {error}")
+            return
+        
+        # Show response (all status codes)
+        result_text = f"Status: {response.status_code}\nURL: {url}\nResponse: {response.text[:1000]}"
+        
+        # Show response in appropriate dialog based on status
+        if response.status_code == 200:
+            messagebox.showinfo("Send Result", result_text)
+            # If successful and we have a pending prospect, save it
+            if self.state_manager.state.pending_prospect:
+                self.state_manager.save_prospect_after_successful_send()
+                messagebox.showinfo("Success", "Prospect saved successfully!")
+        else:
+            messagebox.showwarning("Webhook Response", result_text)
     
     def save_custom_schema(self) -> None:
         """Save current payload as custom schema."""
@@ -721,16 +893,31 @@ class BonzoBuddyApp(ctk.CTk):
             try:
                 webhook = self.state_manager.state.selected_organization.webhooks[self.state_manager.state.selected_webhook_index]
                 payload_text = self.payload_viewer.get("1.0", "end-1c")
-                payload_dict = json.loads(payload_text)
+                payload_dict = self._parse_payload(payload_text)
                 
                 self.state_manager.payload_service.save_custom_schema(webhook.name, schema_name, payload_dict)
                 messagebox.showinfo("Success", f"Custom schema '{schema_name}' saved!")
                 
-            except json.JSONDecodeError:
+            except json_io.JSONDecodeError:
                 messagebox.showerror("Error", "Invalid JSON in payload")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save schema: {e}")
     
+    def _parse_payload(self, payload_text: str) -> Any:
+        """Parse payload JSON, reusing the last result when the text is unchanged."""
+        cached = self._parsed_payload
+        if cached is not None and cached[0] == payload_text:
+            return cached[1]
+        
+        payload = json_io.loads(payload_text)
+        self._parsed_payload = (payload_text, payload)
+        return payload
+    
     def run(self) -> None:
         """Start the application."""
-        self.mainloop()
\ No newline at end of file
+        try:
+            self.mainloop()
+        finally:
+            # Write any debounced organization changes before exiting; a failed
+            # write raises here (main reports it) rather than being lost silently
+            self.state_manager.data_service.flush_organizations()
\ No newline at end of file
@@ -1,25 +1,71 @@
 import customtkinter as ctk
 import tkinter.messagebox as messagebox
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .theme import get_font
 
 if TYPE_CHECKING:
     from ..state.app_state import AppStateManager
 
 
-class AddOrganizationPopup(ctk.CTkToplevel):
+def _clear_entry(entry: ctk.CTkEntry) -> None:
+    """Empty an entry, leaving an active placeholder untouched."""
+    # get() returns "" while the placeholder is shown; deleting then would
+    # re-activate it and lose the entry's show="*" masking
+    if entry.get():
+        entry.delete(0, "end")
+
+
+class ReusablePopup(ctk.CTkToplevel):
+    """
+    Popup that is hidden instead of destroyed when closed.
+    
+    The main window keeps one instance per popup type and calls reset()
+    followed by deiconify() to show it again, so the Toplevel and its
+    widgets are only built once.
+    """
+    
     def __init__(self, parent, state_manager: 'AppStateManager'):
         super().__init__(parent)
         self.state_manager = state_manager
+        self.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def reset(self) -> None:
+        """Restore the popup's fields before it is shown again."""
+        pass
+    
+    def close(self) -> None:
+        """Release the grab and hide the popup for reuse."""
+        self.grab_release()
+        self.withdraw()
+        self._error_label.grid_remove()
+    
+    def _create_error_label(self, row: int, columnspan: int = 1) -> None:
+        """Grid a hidden label below the buttons for validation errors."""
+        self._error_label = ctk.CTkLabel(self, text="", font=get_font(12), text_color="#F44336", wraplength=360)
+        self._error_label.grid(row=row, column=0, columnspan=columnspan, padx=20, pady=(0, 10))
+        self._error_label.grid_remove()
+    
+    def _show_error(self, message: str) -> None:
+        """Show an error inline instead of opening a modal dialog."""
+        self._error_label.configure(text=message)
+        self._error_label.grid()
+
+
+class AddOrganizationPopup(ReusablePopup):
+    def __init__(self, parent, state_manager: 'AppStateManager'):
+        super().__init__(parent, state_manager)
         
         self.title("Add Organization")
-        self.geometry("400x300")
+        self.geometry("400x330")
         self.resizable(False, False)
         
         # Configure grid
         self.grid_columnconfigure(1, weight=1)
         
         # Title
-        title_label = ctk.CTkLabel(self, text="Add New Organization", font=ctk.CTkFont(size=18, weight="bold"))
+        title_label = ctk.CTkLabel(self, text="Add New Organization", font=get_font(18, "bold"))
         title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=20)
         
         # Organization Name
@@ -43,70 +89,67 @@ class AddOrganizationPopup(ctk.CTkToplevel):
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.destroy, fg_color="#607D8B", hover_color="#546E7A")
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.close, fg_color="#607D8B", hover_color="#546E7A")
         cancel_btn.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         
         save_btn = ctk.CTkButton(button_frame, text="Save", command=self.save_organization, fg_color="#4CAF50", hover_color="#45a049")
         save_btn.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
         
+        self._create_error_label(row=5, columnspan=2)
+        
         # Focus on first field
         self.name_entry.focus()
     
+    def reset(self) -> None:
+        """Clear the fields for a new organization."""
+        for entry in (self.name_entry, self.id_entry, self.owner_id_entry):
+            _clear_entry(entry)
+        self.name_entry.focus()
+    
     def save_organization(self):
         name = self.name_entry.get().strip()
         org_id = self.id_entry.get().strip()
         owner_id = self.owner_id_entry.get().strip()
         
         if not all([name, org_id, owner_id]):
-            messagebox.showerror("Error", "All fields are required")
+            self._show_error("All fields are required")
             return
         
         try:
             self.state_manager.add_organization(org_id, name, owner_id)
-            self.destroy()
+            self.close()
         except ValueError as e:
-            messagebox.showerror("Error", str(e))
+            self._show_error(str(e))
 
 
-class EditOrganizationPopup(ctk.CTkToplevel):
+class EditOrganizationPopup(ReusablePopup):
     def __init__(self, parent, state_manager: 'AppStateManager'):
-        super().__init__(parent)
-        self.state_manager = state_manager
-        
-        if not state_manager.state.selected_organization:
-            self.destroy()
-            return
+        super().__init__(parent, state_manager)
         
         self.title("Edit Organization")
-        self.geometry("400x300")
+        self.geometry("400x330")
         self.resizable(False, False)
         
         # Configure grid
         self.grid_columnconfigure(1, weight=1)
         
         # Title
-        title_label = ctk.CTkLabel(self, text="Edit Organization", font=ctk.CTkFont(size=18, weight="bold"))
+        title_label = ctk.CTkLabel(self, text="Edit Organization", font=get_font(18, "bold"))
         title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=20)
         
-        # Get current values
-        org = state_manager.state.selected_organization
-        
         # Organization Name
         ctk.CTkLabel(self, text="Name:").grid(row=1, column=0, padx=20, pady=10, sticky="w")
         self.name_entry = ctk.CTkEntry(self)
-        self.name_entry.insert(0, org.name)
         self.name_entry.grid(row=1, column=1, padx=20, pady=10, sticky="ew")
         
         # Organization ID
         ctk.CTkLabel(self, text="Organization ID:").grid(row=2, column=0, padx=20, pady=10, sticky="w")
         self.id_entry = ctk.CTkEntry(self)
-        self.id_entry.insert(0, org.id)
         self.id_entry.grid(row=2, column=1, padx=20, pady=10, sticky="ew")
         
         # Owner ID
         ctk.CTkLabel(self, text="Owner ID:").grid(row=3, column=0, padx=20, pady=10, sticky="w")
         self.owner_id_entry = ctk.CTkEntry(self)
-        self.owner_id_entry.insert(0, org.owner_id)
         self.owner_id_entry.grid(row=3, column=1, padx=20, pady=10, sticky="ew")
         
         # Buttons
@@ -115,13 +158,23 @@ class EditOrganizationPopup(ctk.CTkToplevel):
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.destroy, fg_color="#607D8B", hover_color="#546E7A")
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.close, fg_color="#607D8B", hover_color="#546E7A")
         cancel_btn.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         
         save_btn = ctk.CTkButton(button_frame, text="Save", command=self.save_organization, fg_color="#4CAF50", hover_color="#45a049")
         save_btn.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
         
-        # Focus on first field
+        self._create_error_label(row=5, columnspan=2)
+        
+        # Fill in the current values and focus on first field
+        self.reset()
+    
+    def reset(self) -> None:
+        """Fill the fields from the currently selected organization."""
+        org = self.state_manager.state.selected_organization
+        for entry, value in ((self.name_entry, org.name), (self.id_entry, org.id), (self.owner_id_entry, org.owner_id)):
+            _clear_entry(entry)
+            entry.insert(0, value)
         self.name_entry.focus()
     
     def save_organization(self):
@@ -130,20 +183,19 @@ class EditOrganizationPopup(ctk.CTkToplevel):
         owner_id = self.owner_id_entry.get().strip()
         
         if not all([name, org_id, owner_id]):
-            messagebox.showerror("Error", "All fields are required")
+            self._show_error("All fields are required")
             return
         
         try:
             self.state_manager.update_organization(org_id, name, owner_id)
-            self.destroy()
+            self.close()
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self._show_error(str(e))
 
 
-class AddWebhookPopup(ctk.CTkToplevel):
+class AddWebhookPopup(ReusablePopup):
     def __init__(self, parent, state_manager: 'AppStateManager'):
-        super().__init__(parent)
-        self.state_manager = state_manager
+        super().__init__(parent, state_manager)
         
         self.title("Add Webhook")
         self.geometry("600x500")
@@ -154,7 +206,7 @@ class AddWebhookPopup(ctk.CTkToplevel):
         self.grid_rowconfigure(1, weight=1)
         
         # Title
-        title_label = ctk.CTkLabel(self, text="Add New Webhook", font=ctk.CTkFont(size=18, weight="bold"))
+        title_label = ctk.CTkLabel(self, text="Add New Webhook", font=get_font(18, "bold"))
         title_label.grid(row=0, column=0, padx=20, pady=20)
         
         # Integration selection frame
@@ -162,6 +214,8 @@ class AddWebhookPopup(ctk.CTkToplevel):
         self.integration_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
         
         self.selected_integration = None
+        self._integration_buttons: Dict[str, ctk.CTkButton] = {}
+        self._selected_button: Optional[ctk.CTkButton] = None
         self.create_integration_tiles()
         
         # URL entry frame
@@ -179,11 +233,23 @@ class AddWebhookPopup(ctk.CTkToplevel):
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.destroy, fg_color="#607D8B", hover_color="#546E7A")
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.close, fg_color="#607D8B", hover_color="#546E7A")
         cancel_btn.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         
         self.save_btn = ctk.CTkButton(button_frame, text="Save", command=self.save_webhook, state="disabled", fg_color="#4CAF50", hover_color="#45a049")
         self.save_btn.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+        
+        self._create_error_label(row=4)
+    
+    def reset(self) -> None:
+        """Clear the integration selection and URL."""
+        self.selected_integration = None
+        if self._selected_button is not None:
+            self._selected_button.configure(fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"])
+            self._selected_button = None
+        
+        _clear_entry(self.url_entry)
+        self.save_btn.configure(state="disabled")
     
     def create_integration_tiles(self):
         """Create integration selection tiles dynamically from filesystem."""
@@ -202,7 +268,7 @@ class AddWebhookPopup(ctk.CTkToplevel):
             category_label = ctk.CTkLabel(
                 self.integration_frame, 
                 text=category_display, 
-                font=ctk.CTkFont(size=16, weight="bold")
+                font=get_font(16, "bold")
             )
             category_label.grid(row=row, column=0, columnspan=3, padx=10, pady=(10, 5), sticky="w")
             row += 1
@@ -213,11 +279,12 @@ class AddWebhookPopup(ctk.CTkToplevel):
                 btn = ctk.CTkButton(
                     self.integration_frame,
                     text=integration,
-                    command=lambda integ=integration: self.select_integration(integ),
+                    command=partial(self.select_integration, integration),
                     width=150,
                     height=40
                 )
                 btn.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+                self._integration_buttons[integration] = btn
                 
                 col += 1
                 if col >= 3:
@@ -231,12 +298,12 @@ class AddWebhookPopup(ctk.CTkToplevel):
         """Handle integration selection."""
         self.selected_integration = integration
         
-        # Update button states - highlight selected
-        for widget in self.integration_frame.winfo_children():
-            if isinstance(widget, ctk.CTkButton) and widget.cget("text") == integration:
-                widget.configure(fg_color="#1565C0")
-            elif isinstance(widget, ctk.CTkButton):
-                widget.configure(fg_color="transparent")
+        # Highlight the selected tile and restore the previously selected one
+        button = self._integration_buttons[integration]
+        if self._selected_button is not None and self._selected_button is not button:
+            self._selected_button.configure(fg_color=ctk.ThemeManager.theme["CTkButton"]["fg_color"])
+        button.configure(fg_color="#1565C0")
+        self._selected_button = button
         
         self.save_btn.configure(state="normal")
     
@@ -245,11 +312,11 @@ class AddWebhookPopup(ctk.CTkToplevel):
         url = self.url_entry.get().strip()
         
         if not url:
-            messagebox.showerror("Error", "Webhook URL is required")
+            self._show_error("Webhook URL is required")
             return
         
         if not self.selected_integration:
-            messagebox.showerror("Error", "Please select an integration")
+            self._show_error("Please select an integration")
             return
         
         # Use the new naming convention: "{Integration} for {Organization}"
@@ -258,18 +325,17 @@ class AddWebhookPopup(ctk.CTkToplevel):
         
         try:
             self.state_manager.add_webhook(webhook_name, url)
-            self.destroy()
+            self.close()
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self._show_error(str(e))
 
 
-class SetAdminPasswordPopup(ctk.CTkToplevel):
+class SetAdminPasswordPopup(ReusablePopup):
     def __init__(self, parent, state_manager: 'AppStateManager'):
-        super().__init__(parent)
-        self.state_manager = state_manager
+        super().__init__(parent, state_manager)
         
         self.title("Set Admin Password")
-        self.geometry("450x300")
+        self.geometry("450x330")
         self.resizable(False, False)
         
         # Configure grid
@@ -279,28 +345,26 @@ class SetAdminPasswordPopup(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             self, 
             text="Set Admin Password", 
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(18, "bold")
         )
         title_label.grid(row=0, column=0, columnspan=2, padx=20, pady=20)
         
         description_label = ctk.CTkLabel(
             self,
             text="This password is used for impersonating users in the Bonzo platform.\nIt will be stored securely in your system keychain.",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             justify="center"
         )
         description_label.grid(row=1, column=0, columnspan=2, padx=20, pady=(0, 20))
         
-        # Check if password already exists
-        existing_password = self.state_manager.keyring_service.get_admin_password()
-        if existing_password:
-            status_label = ctk.CTkLabel(
-                self,
-                text="✓ Admin password is currently set",
-                font=ctk.CTkFont(size=12),
-                text_color="green"
-            )
-            status_label.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 10))
+        # Shown by reset() when a password already exists
+        self.status_label = ctk.CTkLabel(
+            self,
+            text="✓ Admin password is currently set",
+            font=get_font(12),
+            text_color="green"
+        )
+        self.status_label.grid(row=2, column=0, columnspan=2, padx=20, pady=(0, 10))
         
         # Password entry
         ctk.CTkLabel(self, text="Password:").grid(row=3, column=0, padx=20, pady=10, sticky="w")
@@ -318,12 +382,27 @@ class SetAdminPasswordPopup(ctk.CTkToplevel):
         button_frame.grid_columnconfigure(0, weight=1)
         button_frame.grid_columnconfigure(1, weight=1)
         
-        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.destroy, fg_color="#607D8B", hover_color="#546E7A")
+        cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=self.close, fg_color="#607D8B", hover_color="#546E7A")
         cancel_btn.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
         
         save_btn = ctk.CTkButton(button_frame, text="Save", command=self.save_admin_password, fg_color="#4CAF50", hover_color="#45a049")
         save_btn.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
         
+        self._create_error_label(row=6, columnspan=2)
+        
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear the password fields and refresh the password status."""
+        # Check if password already exists
+        if self.state_manager.keyring_service.has_admin_password():
+            self.status_label.grid()
+        else:
+            self.status_label.grid_remove()
+        
+        _clear_entry(self.password_entry)
+        _clear_entry(self.confirm_entry)
+        
         # Focus on password field
         self.password_entry.focus()
     
@@ -333,16 +412,16 @@ class SetAdminPasswordPopup(ctk.CTkToplevel):
         confirm = self.confirm_entry.get()
         
         if not password:
-            messagebox.showerror("Error", "Password cannot be empty")
+            self._show_error("Password cannot be empty")
             return
         
         if password != confirm:
-            messagebox.showerror("Error", "Passwords do not match")
+            self._show_error("Passwords do not match")
             return
         
         try:
             self.state_manager.keyring_service.set_admin_password(password)
             messagebox.showinfo("Success", "Admin password saved successfully")
-            self.destroy()
+            self.close()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save admin password: {e}")
\ No newline at end of file
+            self._show_error(f"Failed to save admin password: {e}")
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Shared UI theme: the color scheme and a cache of CTkFont instances.
+
+Creating a CTkFont goes through Tk's font system, so fonts are created once
+and reused by the main window and every popup.
+"""
+
+import customtkinter as ctk
+from typing import Dict, Optional, Tuple
+
+
+# Modern Color Scheme
+COLORS = {
+    # Primary actions
+    "primary": "#4CAF50",      # Green for main actions
+    "primary_hover": "#45a049",
+    
+    # Secondary actions  
+    "secondary": "#2196F3",    # Blue for secondary actions
+    "secondary_hover": "#1976D2",
+    
+    # Warning/Delete actions
+    "warning": "#FF5722",      # Red-orange for delete/warning
+    "warning_hover": "#E64A19",
+    
+    # Bonzo brand colors
+    "bonzo": "#FF6B35",        # Bonzo orange
+    "bonzo_hover": "#E55A2B",
+    
+    # Special actions
+    "accent": "#9C27B0",       # Purple for special features
+    "accent_hover": "#7B1FA2",
+    
+    # Neutral actions
+    "neutral": "#607D8B",      # Blue-grey for neutral actions
+    "neutral_hover": "#546E7A",
+    
+    # Success
+    "success": "#4CAF50",
+    "success_hover": "#388E3C",
+    
+    # Selected state
+    "selected": "#1565C0",     # Darker blue for selected items
+    
+    # Frames
+    "frame_border": "#37474F"  # Dark grey for frame borders
+}
+
+
+
+_font_cache: Dict[Tuple[Optional[str], int, str], ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """
+    Get the shared CTkFont for a size/weight/family, creating it on first use.
+    
+    Requires the Tk root window to exist.
+    """
+    key = (family, size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        if family:
+            font = ctk.CTkFont(family=family, size=size, weight=weight)
+        else:
+            font = ctk.CTkFont(size=size, weight=weight)
+        _font_cache[key] = font
+    return font
@@ -0,0 +1,186 @@
+import sys
+import tkinter
+import customtkinter as ctk
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+# (text, command, is_selected) for one row of a VirtualList
+VirtualRow = Tuple[str, Callable[[], None], bool]
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list of buttons that only creates widgets for visible rows.
+    
+    Rows have a fixed height, so the visible range is computed from the
+    scroll offset. A small pool of buttons covering the viewport (plus some
+    overscan) is recycled with configure() as the list scrolls or changes,
+    instead of one button being created per row.
+    """
+    
+    ROW_HEIGHT = 50  # 40px button plus 5px padding above and below
+    BUTTON_HEIGHT = 40
+    PADDING = 5
+    OVERSCAN = 2
+    
+    def __init__(self, master, font: ctk.CTkFont, selected_color: str, **kwargs):
+        super().__init__(master, **kwargs)
+        
+        self._font = font
+        self._selected_color = selected_color
+        self._default_color = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+        
+        self._rows: List[VirtualRow] = []
+        # Pooled buttons and the canvas window item each one is placed in
+        self._pool: List[Tuple[ctk.CTkButton, int]] = []
+        # What each pooled button currently shows, so unchanged rows are not reconfigured
+        self._slot_rows: List[Optional[VirtualRow]] = []
+        self._slot_layout: List[Optional[Tuple[int, int]]] = []
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self._canvas = tkinter.Canvas(self, highlightthickness=0)
+        self._canvas.grid(row=0, column=0, sticky="nsew", padx=(self.PADDING, 0), pady=self.PADDING)
+        
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._canvas.yview)
+        self._scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, self.PADDING), pady=self.PADDING)
+        
+        self._canvas.configure(yscrollcommand=self._on_yscroll)
+        self._set_scroll_increments()
+        self._update_canvas_color()
+        
+        self._canvas.bind("<Configure>", lambda event: self._render())
+        self._bind_mouse_wheel(self._canvas)
+    
+    def set_rows(self, rows: Sequence[VirtualRow]) -> None:
+        """Replace the list contents and re-render the visible rows."""
+        self._rows = list(rows)
+        self.invalidate()
+    
+    def invalidate(self) -> None:
+        """Update the scroll region for the current rows and re-render."""
+        width = self._canvas.winfo_width()
+        self._canvas.configure(scrollregion=(0, 0, width, len(self._rows) * self.ROW_HEIGHT))
+        
+        # Snap back into range if the list shrank below the scroll offset
+        if self._canvas.canvasy(0) > max(0, len(self._rows) * self.ROW_HEIGHT - self._canvas.winfo_height()):
+            self._canvas.yview_moveto(0)
+        
+        self._render()
+    
+    def _visible_range(self) -> Tuple[int, int]:
+        """Return the [first, last) row indexes to render, including overscan."""
+        top = self._canvas.canvasy(0)
+        height = self._canvas.winfo_height()
+        
+        first = max(0, int(top // self.ROW_HEIGHT) - self.OVERSCAN)
+        last = min(len(self._rows), int((top + height) // self.ROW_HEIGHT) + 1 + self.OVERSCAN)
+        return first, max(first, last)
+    
+    def _render(self) -> None:
+        """Place pooled buttons over the visible rows and hide the rest."""
+        first, last = self._visible_range()
+        width = max(1, self._canvas.winfo_width() - 2 * self.PADDING)
+        
+        while len(self._pool) < last - first:
+            self._pool.append(self._create_pooled_button())
+            self._slot_rows.append(None)
+            self._slot_layout.append(None)
+        
+        for slot, (button, window) in enumerate(self._pool):
+            index = first + slot
+            if index >= last:
+                if self._slot_layout[slot] is not None:
+                    self._canvas.itemconfigure(window, state="hidden")
+                    self._slot_layout[slot] = None
+                continue
+            
+            row = self._rows[index]
+            self._configure_button(button, self._slot_rows[slot], row)
+            self._slot_rows[slot] = row
+            
+            layout = (index, width)
+            if self._slot_layout[slot] != layout:
+                self._canvas.coords(window, self.PADDING, index * self.ROW_HEIGHT + self.PADDING)
+                self._canvas.itemconfigure(window, width=width, state="normal")
+                self._slot_layout[slot] = layout
+    
+    def _configure_button(self, button: ctk.CTkButton, old_row: Optional[VirtualRow], row: VirtualRow) -> None:
+        """Configure only the button options that differ from what it shows now."""
+        text, command, is_selected = row
+        if old_row is None:
+            old_text, old_command, old_selected = None, None, None
+        else:
+            old_text, old_command, old_selected = old_row
+        
+        changes = {}
+        if text != old_text:
+            changes["text"] = text
+        if command is not old_command:
+            changes["command"] = command
+        if is_selected != old_selected:
+            changes["fg_color"] = self._selected_color if is_selected else self._default_color
+        
+        if changes:
+            button.configure(**changes)
+    
+    def _create_pooled_button(self) -> Tuple[ctk.CTkButton, int]:
+        """Create a hidden button and the canvas window that positions it."""
+        button = ctk.CTkButton(self._canvas, text="", font=self._font, height=self.BUTTON_HEIGHT)
+        self._bind_mouse_wheel(button)
+        window = self._canvas.create_window(
+            0, 0,
+            window=button,
+            anchor="nw",
+            height=self.BUTTON_HEIGHT,
+            state="hidden"
+        )
+        return button, window
+    
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Keep the scrollbar in sync and render rows scrolled into view."""
+        self._scrollbar.set(first, last)
+        self._render()
+    
+    def _update_canvas_color(self) -> None:
+        """Match the canvas background to this frame's color."""
+        color = self.cget("fg_color")
+        if color == "transparent":
+            color = self.cget("bg_color")
+        self._canvas.configure(bg=self._apply_appearance_mode(color))
+    
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, "_canvas"):
+            self._update_canvas_color()
+    
+    def _set_scroll_increments(self) -> None:
+        # Same per-platform increments as CTkScrollableFrame
+        if sys.platform.startswith("win"):
+            self._canvas.configure(yscrollincrement=1)
+        elif sys.platform == "darwin":
+            self._canvas.configure(yscrollincrement=8)
+        else:
+            self._canvas.configure(yscrollincrement=30)
+    
+    def _bind_mouse_wheel(self, widget) -> None:
+        """Scroll the list when the mouse wheel is used over the widget."""
+        if sys.platform.startswith("win") or sys.platform == "darwin":
+            widget.bind("<MouseWheel>", self._on_mouse_wheel, add=True)
+        else:
+            widget.bind("<Button-4>", self._on_mouse_wheel, add=True)
+            widget.bind("<Button-5>", self._on_mouse_wheel, add=True)
+    
+    def _on_mouse_wheel(self, event) -> Optional[str]:
+        """Scroll by the wheel delta, ignoring lists that fit in the viewport."""
+        if self._canvas.yview() == (0.0, 1.0):
+            return None
+        
+        if sys.platform.startswith("win"):
+            self._canvas.yview_scroll(-int(event.delta / 6), "units")
+        elif sys.platform == "darwin":
+            self._canvas.yview_scroll(-event.delta, "units")
+        else:
+            self._canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+        return "break"
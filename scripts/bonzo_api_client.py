@@ -2,18 +2,29 @@
 Bonzo API Client for superuser authentication and prospect validation.
 """
 
-import http.client
-import json
+import operator
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from urllib.parse import urlencode, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import urllib3
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
 import logging
 
+from app import json_io
+
 logger = logging.getLogger(__name__)
 
+# Required prospect fields in ProspectData order, split around the optional email/phone
+_REQUIRED_PROSPECT_FIELDS = operator.itemgetter(
+    'id', 'business_entity_id', 'first_name', 'last_name', 'full_name', 'source',
+    'assigned_to', 'assigned_user', 'created_at', 'updated_at', 'business'
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProspectData:
     """Prospect data from Bonzo API."""
     id: int
@@ -29,6 +40,17 @@ class ProspectData:
     created_at: str
     updated_at: str
     business: Dict[str, Any]
+    
+    # Lowercased names, computed once for repeated find_test_prospects filtering
+    _first_name_lower: str = field(init=False, repr=False, compare=False)
+    _last_name_lower: str = field(init=False, repr=False, compare=False)
+    _full_name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Handle None values safely
+        self._first_name_lower = (self.first_name or "").lower()
+        self._last_name_lower = (self.last_name or "").lower()
+        self._full_name_lower = (self.full_name or "").lower()
 
 
 class BonzoAPIError(Exception):
@@ -39,6 +61,17 @@ class BonzoAPIError(Exception):
 class BonzoAPIClient:
     """Client for interacting with Bonzo API using superuser authentication."""
     
+    # Upper bound for the backed-off interval between wait_for_prospects polls, in seconds
+    MAX_POLL_INTERVAL = 60
+    
+    # How far before the newest match later wait_for_prospects polls start, in seconds.
+    # Records created in the same second as (or just before) the newest match
+    # may still be missing, whether or not the API's created_after is inclusive.
+    POLL_CUTOFF_MARGIN = 60
+    
+    # Pooled connections per host, and so the number of users queried concurrently
+    MAX_CONCURRENT_REQUESTS = 4
+    
     def __init__(self, superuser_api_key: str, base_url: str = "app.getbonzo.com"):
         """
         Initialize Bonzo API client.
@@ -51,6 +84,37 @@ class BonzoAPIClient:
         self.base_url = base_url
         self.timeout = 30
         
+        # Headers sent with every request, built once. Compressed responses
+        # are decoded by urllib3 before parsing.
+        self._base_headers = {
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Authorization': f'Bearer {self.superuser_api_key}',
+            'Content-Type': 'application/json'
+        }
+        
+        # Pooled keep-alive connections, so polling doesn't pay a TLS handshake per request.
+        # Redirects are returned rather than followed, as with a bare http.client request.
+        self._http = urllib3.PoolManager(
+            maxsize=self.MAX_CONCURRENT_REQUESTS,
+            timeout=self.timeout,
+            retries=urllib3.Retry(total=1, redirect=False),
+            headers=self._base_headers
+        )
+        
+        # Last GET response per (endpoint, user_id): (url, ETag, parsed data)
+        self._etag_cache: Dict[Tuple[str, Optional[int]], Tuple[str, str, Dict[str, Any]]] = {}
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.clear()
+    
+    def __enter__(self) -> 'BonzoAPIClient':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
     def _make_request(
         self, 
         method: str, 
@@ -70,50 +134,57 @@ class BonzoAPIClient:
             data: Request body data
             
         Returns:
-            Response data as dictionary
+            Response data as dictionary. A GET answered with 304 Not Modified
+            returns the previously parsed (shared) response for the same URL.
             
         Raises:
             BonzoAPIError: On API errors
         """
         try:
-            conn = http.client.HTTPSConnection(self.base_url)
-            
-            # Prepare headers
-            headers = {
-                'Accept': 'application/json',
-                'Authorization': f'Bearer {self.superuser_api_key}',
-                'Content-Type': 'application/json'
-            }
-            
+            # The pool sends the base headers; per-request headers replace them,
+            # so a copy is only made when a request needs extra headers
+            headers = None
             if user_id:
-                headers['On-Behalf-Of'] = str(user_id)
+                headers = {**self._base_headers, 'On-Behalf-Of': str(user_id)}
             
             # Prepare URL with query parameters
             url = endpoint
             if params:
                 url += '?' + urlencode(params)
             
+            # Revalidate a repeated GET so an unchanged response skips the body and parsing
+            cache_key = (endpoint, user_id)
+            cached = self._etag_cache.get(cache_key) if method == 'GET' else None
+            if cached is not None and cached[0] == url:
+                if headers is None:
+                    headers = dict(self._base_headers)
+                headers['If-None-Match'] = cached[1]
+            else:
+                cached = None
+            
             # Prepare request body
             request_data = None
             if data:
-                request_data = json.dumps(data)
+                request_data = json_io.dumps(data)
             
             logger.info(f"Making {method} request to {url}")
             if user_id:
                 logger.info(f"Using On-Behalf-Of: {user_id}")
             
             # Make request
-            conn.request(method, url, body=request_data, headers=headers)
-            response = conn.getresponse()
-            response_data = response.read()
+            response = self._http.request(method, f'https://{self.base_url}{url}', body=request_data, headers=headers)
+            response_data = response.data
             
             logger.info(f"Response status: {response.status}")
             
+            if response.status == 304 and cached is not None:
+                return cached[2]
+            
             # Parse response
             if response_data:
                 try:
-                    parsed_data = json.loads(response_data.decode('utf-8'))
-                except json.JSONDecodeError:
+                    parsed_data = json_io.loads(response_data)
+                except json_io.JSONDecodeError:
                     parsed_data = {"raw_response": response_data.decode('utf-8')}
             else:
                 parsed_data = {}
@@ -127,6 +198,10 @@ class BonzoAPIClient:
                     error_msg += f": {parsed_data['error']}"
                 raise BonzoAPIError(error_msg)
             
+            etag = response.headers.get('ETag')
+            if method == 'GET' and etag:
+                self._etag_cache[cache_key] = (url, etag, parsed_data)
+            
             return parsed_data
             
         except Exception as e:
@@ -134,14 +209,13 @@ class BonzoAPIClient:
                 raise
             logger.error(f"API request failed: {e}")
             raise BonzoAPIError(f"API request failed: {e}")
-        finally:
-            conn.close()
     
     def get_user_prospects(
         self, 
         user_id: int, 
         limit: int = 100,
-        created_after: Optional[str] = None
+        created_after: Optional[str] = None,
+        search: Optional[str] = None
     ) -> List[ProspectData]:
         """
         Get prospects for a specific user using On-Behalf-Of.
@@ -150,13 +224,44 @@ class BonzoAPIClient:
             user_id: User ID to get prospects for
             limit: Maximum number of prospects to return
             created_after: ISO datetime string to filter prospects created after
+            search: Optional server-side search query
             
         Returns:
             List of ProspectData objects
         """
+        prospects = list(self.iter_user_prospects(user_id, limit=limit, created_after=created_after, search=search))
+        
+        logger.info(f"Retrieved {len(prospects)} prospects for user {user_id}")
+        return prospects
+    
+    def iter_user_prospects(
+        self,
+        user_id: int,
+        limit: int = 100,
+        created_after: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> Iterator[ProspectData]:
+        """
+        Yield prospects for a specific user using On-Behalf-Of.
+        
+        The request is made when iteration starts. ProspectData objects are
+        built as they are consumed, so a caller that stops early skips
+        constructing the rest of the response.
+        
+        Args:
+            user_id: User ID to get prospects for
+            limit: Maximum number of prospects to return
+            created_after: ISO datetime string to filter prospects created after
+            search: Optional server-side search query
+            
+        Yields:
+            ProspectData objects
+        """
         params = {'limit': limit}
         if created_after:
             params['created_after'] = created_after
+        if search:
+            params['search'] = search
         
         logger.info(f"Getting prospects for user {user_id}")
         
@@ -167,62 +272,112 @@ class BonzoAPIClient:
             params=params
         )
         
-        prospects = []
-        for prospect_data in response.get('data', []):
+        for prospect_data in response.get('data', ()):
             try:
-                prospect = ProspectData(
-                    id=prospect_data['id'],
-                    business_entity_id=prospect_data['business_entity_id'],
-                    first_name=prospect_data['first_name'],
-                    last_name=prospect_data['last_name'],
-                    full_name=prospect_data['full_name'],
-                    source=prospect_data['source'],
-                    email=prospect_data.get('email'),
-                    phone=prospect_data.get('phone'),
-                    assigned_to=prospect_data['assigned_to'],
-                    assigned_user=prospect_data['assigned_user'],
-                    created_at=prospect_data['created_at'],
-                    updated_at=prospect_data['updated_at'],
-                    business=prospect_data['business']
-                )
-                prospects.append(prospect)
+                values = _REQUIRED_PROSPECT_FIELDS(prospect_data)
             except KeyError as e:
                 logger.warning(f"Skipping prospect due to missing field {e}: {prospect_data}")
                 continue
+            
+            yield ProspectData(
+                *values[:6],
+                prospect_data.get('email'),
+                prospect_data.get('phone'),
+                *values[6:]
+            )
+    
+    def get_prospects_for_users(
+        self,
+        user_ids: Sequence[int],
+        limit: int = 100,
+        created_after: Optional[str] = None
+    ) -> Dict[int, List[ProspectData]]:
+        """
+        Get prospects for several users concurrently over the pooled connections.
         
-        logger.info(f"Retrieved {len(prospects)} prospects for user {user_id}")
-        return prospects
+        Args:
+            user_ids: User IDs to get prospects for
+            limit: Maximum number of prospects to return per user
+            created_after: ISO datetime string to filter prospects created after
+            
+        Returns:
+            Dictionary mapping each user ID to its list of ProspectData objects
+            
+        Raises:
+            BonzoAPIError: If any user's request fails
+        """
+        return self._map_users(
+            lambda user_id: self.get_user_prospects(user_id, limit=limit, created_after=created_after),
+            user_ids
+        )
     
-    def find_test_prospects(
+    def _map_users(self, func, user_ids: Sequence[int]) -> Dict[int, Any]:
+        """Run func for each user ID on a thread pool sized to the connection pool."""
+        if not user_ids:
+            return {}
+        
+        max_workers = min(self.MAX_CONCURRENT_REQUESTS, len(user_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(user_ids, executor.map(func, user_ids)))
+    
+    def search_user_prospects(
         self,
         user_id: int,
-        test_pattern: str,
+        query: str,
+        limit: int = 100,
         created_after: Optional[str] = None
+    ) -> List[ProspectData]:
+        """
+        Get a user's prospects filtered server-side by a search query.
+        
+        Only matching prospects are sent back, so the response is smaller
+        than a full get_user_prospects listing.
+        
+        Args:
+            user_id: User ID to search prospects for
+            query: Search query passed to the API
+            limit: Maximum number of prospects to return
+            created_after: ISO datetime string to filter prospects created after
+            
+        Returns:
+            List of ProspectData objects
+        """
+        return self.get_user_prospects(user_id, limit=limit, created_after=created_after, search=query)
+    
+    def find_test_prospects(
+        self,
+        user_id: int,
+        test_pattern: Union[str, Sequence[str]],
+        created_after: Optional[str] = None,
+        max_results: Optional[int] = None
     ) -> List[ProspectData]:
         """
         Find test prospects by name pattern for a specific user.
         
         Args:
             user_id: User ID to search prospects for
-            test_pattern: Pattern to match in prospect names (e.g., "TestRecord_MonitorBase")
+            test_pattern: Pattern to match in prospect names (e.g., "TestRecord_MonitorBase"),
+                or several patterns, any of which may match
             created_after: ISO datetime string to filter prospects created after
+            max_results: Stop after this many matches (default: no limit)
             
         Returns:
             List of matching ProspectData objects
         """
-        all_prospects = self.get_user_prospects(user_id, created_after=created_after)
-        
-        test_prospects = []
-        for prospect in all_prospects:
-            # Handle None values safely
-            first_name = (prospect.first_name or "").lower()
-            last_name = (prospect.last_name or "").lower() 
-            full_name = (prospect.full_name or "").lower()
-            
-            if (test_pattern.lower() in first_name or 
-                test_pattern.lower() in last_name or
-                test_pattern.lower() in full_name):
-                test_prospects.append(prospect)
+        # Names are lowercased once on ProspectData, so only the patterns are lowered here
+        patterns = [test_pattern] if isinstance(test_pattern, str) else test_pattern
+        patterns_lower = [pattern.lower() for pattern in patterns]
+        
+        matches = (
+            prospect for prospect in self.iter_user_prospects(user_id, created_after=created_after)
+            if any(
+                pattern in prospect._first_name_lower or
+                pattern in prospect._last_name_lower or
+                pattern in prospect._full_name_lower
+                for pattern in patterns_lower
+            )
+        )
+        test_prospects = list(islice(matches, max_results))
         
         logger.info(f"Found {len(test_prospects)} test prospects matching '{test_pattern}' for user {user_id}")
         return test_prospects
@@ -235,7 +390,9 @@ class BonzoAPIClient:
         expected_team_id: int
     ) -> Dict[str, bool]:
         """
-        Validate that a prospect is assigned correctly.
+        Validate that a prospect is assigned correctly, field by field.
+        
+        Use is_prospect_assigned_correctly when only the overall result is needed.
         
         Args:
             prospect: ProspectData to validate
@@ -271,6 +428,33 @@ class BonzoAPIClient:
         
         return results
     
+    def is_prospect_assigned_correctly(
+        self,
+        prospect: ProspectData,
+        expected_user_email: str,
+        expected_user_id: int,
+        expected_team_id: int
+    ) -> bool:
+        """
+        Check that a prospect is assigned correctly in a single comparison.
+        
+        Equivalent to all(validate_prospect_assignment(...).values()) without
+        building the per-field results.
+        
+        Args:
+            prospect: ProspectData to validate
+            expected_user_email: Expected assigned user email
+            expected_user_id: Expected assigned user ID
+            expected_team_id: Expected team ID
+            
+        Returns:
+            True if the user email, user ID, team ID and assigned_to all match
+        """
+        assigned_user = prospect.assigned_user
+        return (
+            assigned_user.get('email'), assigned_user.get('id'), prospect.business_entity_id, prospect.assigned_to
+        ) == (expected_user_email, expected_user_id, expected_team_id, expected_user_id)
+    
     def wait_for_prospects(
         self,
         user_id: int,
@@ -282,12 +466,16 @@ class BonzoAPIClient:
         """
         Wait for test prospects to appear in Bonzo with polling.
         
+        After the first poll only prospects created since POLL_CUTOFF_MARGIN
+        seconds before the newest match are requested, and the interval doubles
+        after each poll that comes up short, up to MAX_POLL_INTERVAL.
+        
         Args:
             user_id: User ID to check
             test_pattern: Pattern to match in prospect names
             expected_count: Expected number of test prospects
             timeout: Maximum time to wait in seconds
-            check_interval: Time between checks in seconds
+            check_interval: Initial time between checks in seconds
             
         Returns:
             List of found ProspectData objects
@@ -296,18 +484,78 @@ class BonzoAPIClient:
             TimeoutError: If expected prospects don't appear within timeout
         """
         start_time = time.time()
+        found: Dict[int, ProspectData] = {}
+        created_after = None
+        interval = check_interval
         
-        while time.time() - start_time < timeout:
-            prospects = self.find_test_prospects(user_id, test_pattern)
+        while True:
+            # Previously found prospects can be returned again (and fill some of
+            # the quota), but never more than have been found, so the
+            # expected_count cap still leaves room for every missing one
+            new_prospects = self.find_test_prospects(
+                user_id, test_pattern, created_after=created_after, max_results=expected_count
+            )
+            for prospect in new_prospects:
+                found[prospect.id] = prospect
+            if found:
+                created_after = self._poll_cutoff(found.values())
             
-            logger.info(f"Found {len(prospects)}/{expected_count} test prospects for user {user_id}")
+            logger.info(f"Found {len(found)}/{expected_count} test prospects for user {user_id}")
             
-            if len(prospects) >= expected_count:
-                return prospects
+            if len(found) >= expected_count:
+                return list(found.values())
             
-            time.sleep(check_interval)
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.MAX_POLL_INTERVAL)
         
         raise TimeoutError(
             f"Timed out waiting for {expected_count} test prospects for user {user_id}. "
-            f"Found {len(prospects)} after {timeout} seconds."
+            f"Found {len(found)} after {timeout} seconds."
+        )
+    
+    @classmethod
+    def _poll_cutoff(cls, prospects) -> Optional[str]:
+        """Return the created_after for the next poll, or None to poll unfiltered."""
+        try:
+            newest = max(
+                datetime.fromisoformat(prospect.created_at.replace('Z', '+00:00'))
+                for prospect in prospects
+            )
+        except (TypeError, ValueError):
+            # Unparseable timestamps; fall back to requesting everything
+            return None
+        return (newest - timedelta(seconds=cls.POLL_CUTOFF_MARGIN)).isoformat()
+    
+    def wait_for_prospects_many(
+        self,
+        user_ids: Sequence[int],
+        test_pattern: str,
+        expected_counts: Dict[int, int],
+        timeout: int = 300,
+        check_interval: int = 10
+    ) -> Dict[int, List[ProspectData]]:
+        """
+        Wait for test prospects for several users, polling them concurrently.
+        
+        Args:
+            user_ids: User IDs to check
+            test_pattern: Pattern to match in prospect names
+            expected_counts: Expected number of test prospects per user ID
+            timeout: Maximum time to wait in seconds
+            check_interval: Initial time between checks in seconds
+            
+        Returns:
+            Dictionary mapping each user ID to its found ProspectData objects
+            
+        Raises:
+            TimeoutError: If any user's prospects don't appear within timeout
+        """
+        return self._map_users(
+            lambda user_id: self.wait_for_prospects(
+                user_id, test_pattern, expected_counts[user_id], timeout, check_interval
+            ),
+            user_ids
         )
\ No newline at end of file
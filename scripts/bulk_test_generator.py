@@ -4,7 +4,6 @@ Bulk test data generator script for integration testing.
 """
 
 import argparse
-import json
 import logging
 import sys
 import yaml
@@ -18,6 +17,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from tests.conftest import TestConfig, TestUser, ValidationRule
 from scripts.test_data_factory import TestDataFactory
 from scripts.webhook_validator import WebhookValidator
+from scripts.parse_cache import load_parsed
+from app import json_io
 
 # Configure logging
 logging.basicConfig(
@@ -27,14 +28,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it, same results as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=_YAML_LOADER)
+
 
 def load_config(config_path: str) -> TestConfig:
     """Load test configuration from YAML file."""
-    if not Path(config_path).exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        config_data = yaml.safe_load(f)
+    try:
+        config_data = load_parsed(config_path, _parse_yaml)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
     # Parse test users
     test_users = []
@@ -49,6 +56,7 @@ def load_config(config_path: str) -> TestConfig:
     return TestConfig(
         test_name=config_data["test_name"],
         webhook_url=config_data["webhook_url"],
+        superuser_webhook_url=config_data.get("superuser_webhook_url", config_data["webhook_url"]),
         superuser_api_key=config_data["superuser_api_key"],
         integration_type=config_data["integration_type"],
         test_records=config_data["test_records"],
@@ -63,11 +71,10 @@ def load_payload_template(integration_type: str) -> Dict[str, Any]:
     """Load payload template for integration."""
     template_path = f"tests/fixtures/{integration_type}_payload_template.json"
     
-    if not Path(template_path).exists():
-        raise FileNotFoundError(f"Payload template not found: {template_path}")
-    
-    with open(template_path, 'r') as f:
-        return json.load(f)
+    try:
+        return load_parsed(template_path, json_io.loads)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Payload template not found: {template_path}") from None
 
 
 def generate_test_data(config: TestConfig, payload_template: Dict[str, Any], dry_run: bool = False) -> None:
@@ -4,14 +4,17 @@ Integration health check script for monitoring integration status.
 """
 
 import argparse
-import json
+import atexit
 import logging
+import requests
 import sys
 import yaml
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -19,6 +22,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from tests.conftest import TestConfig, TestUser, ValidationRule
 from scripts.bonzo_api_client import BonzoAPIClient, BonzoAPIError
 from scripts.webhook_validator import WebhookValidator
+from scripts.parse_cache import load_parsed
+from app import json_io
 
 # Configure logging
 logging.basicConfig(
@@ -28,14 +33,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it, same results as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared by webhook checks so repeated checks in one process reuse the connection
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+atexit.register(_HTTP_SESSION.close)
+
+# Summary symbol for each check status
+_STATUS_SYMBOLS = {
+    'healthy': '✓',
+    'partial': '⚠',
+    'unhealthy': '✗',
+    'unknown': '?'
+}
+
+# Summary titles for the known checks
+_CHECK_TITLES = {
+    'webhook_health': 'Webhook Health',
+    'api_connectivity': 'Api Connectivity',
+    'recent_test_data': 'Recent Test Data'
+}
+
+
+def _parse_yaml(data: bytes) -> Any:
+    return yaml.load(data, Loader=_YAML_LOADER)
+
 
 def load_config(config_path: str) -> TestConfig:
     """Load test configuration from YAML file."""
-    if not Path(config_path).exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        config_data = yaml.safe_load(f)
+    try:
+        config_data = load_parsed(config_path, _parse_yaml)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
     
     # Parse test users
     test_users = []
@@ -50,6 +82,7 @@ def load_config(config_path: str) -> TestConfig:
     return TestConfig(
         test_name=config_data["test_name"],
         webhook_url=config_data["webhook_url"],
+        superuser_webhook_url=config_data.get("superuser_webhook_url", config_data["webhook_url"]),
         superuser_api_key=config_data["superuser_api_key"],
         integration_type=config_data["integration_type"],
         test_records=config_data["test_records"],
@@ -60,11 +93,34 @@ def load_config(config_path: str) -> TestConfig:
     )
 
 
+def _map_test_users(func: Callable[[TestUser], Tuple[Any, int, str]], users: List[TestUser]) -> List[Any]:
+    """
+    Run func for each test user concurrently, returning results in user order.
+    
+    func returns (result, log level, log message). The messages are logged
+    in user order once every check has finished, so workers do not contend
+    for the logging lock or interleave their output.
+    """
+    if not users:
+        return []
+    
+    # One worker per pooled API connection
+    max_workers = min(BonzoAPIClient.MAX_CONCURRENT_REQUESTS, len(users))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(func, users))
+    
+    results = []
+    for result, level, message in outcomes:
+        logger.log(level, message)
+        results.append(result)
+    return results
+
+
 def check_webhook_health(config: TestConfig) -> Dict[str, Any]:
     """Check webhook endpoint health."""
     logger.info("Checking webhook endpoint health...")
     
-    webhook_validator = WebhookValidator(config)
+    webhook_validator = WebhookValidator(config, session=_HTTP_SESSION)
     health_results = webhook_validator.validate_webhook_endpoint()
     
     health_status = {
@@ -87,7 +143,6 @@ def check_api_connectivity(config: TestConfig) -> Dict[str, Any]:
     """Check Bonzo API connectivity and authentication."""
     logger.info("Checking Bonzo API connectivity...")
     
-    api_client = BonzoAPIClient(config.superuser_api_key)
     api_status = {
         'timestamp': datetime.now(timezone.utc).isoformat(),
         'status': 'unknown',
@@ -96,9 +151,7 @@ def check_api_connectivity(config: TestConfig) -> Dict[str, Any]:
         'user_details': []
     }
     
-    accessible_users = 0
-    
-    for user in config.test_users:
+    def check_user(user: TestUser) -> Tuple[Dict[str, Any], int, str]:
         user_status = {
             'user_id': user.user_id,
             'email': user.email,
@@ -112,18 +165,20 @@ def check_api_connectivity(config: TestConfig) -> Dict[str, Any]:
             prospects = api_client.get_user_prospects(user.user_id, limit=10)
             user_status['accessible'] = True
             user_status['prospect_count'] = len(prospects)
-            accessible_users += 1
             
-            logger.info(f"✓ User {user.email} accessible ({len(prospects)} prospects)")
+            return user_status, logging.INFO, f"✓ User {user.email} accessible ({len(prospects)} prospects)"
             
         except BonzoAPIError as e:
             user_status['error'] = str(e)
-            logger.error(f"✗ User {user.email} not accessible: {e}")
+            return user_status, logging.ERROR, f"✗ User {user.email} not accessible: {e}"
         except Exception as e:
             user_status['error'] = f"Unexpected error: {str(e)}"
-            logger.error(f"✗ User {user.email} check failed: {e}")
-        
-        api_status['user_details'].append(user_status)
+            return user_status, logging.ERROR, f"✗ User {user.email} check failed: {e}"
+    
+    with BonzoAPIClient(config.superuser_api_key) as api_client:
+        api_status['user_details'] = _map_test_users(check_user, config.test_users)
+    
+    accessible_users = sum(1 for user_status in api_status['user_details'] if user_status['accessible'])
     
     api_status['users_accessible'] = accessible_users
     api_status['status'] = 'healthy' if accessible_users == len(config.test_users) else 'partial' if accessible_users > 0 else 'unhealthy'
@@ -137,20 +192,19 @@ def check_recent_test_data(config: TestConfig, hours_back: int = 24) -> Dict[str
     """Check for recent test data in Bonzo."""
     logger.info(f"Checking for test data from last {hours_back} hours...")
     
-    api_client = BonzoAPIClient(config.superuser_api_key)
     cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+    cutoff_iso = cutoff_time.isoformat()
+    test_pattern = f"TestRecord_{config.integration_type.title()}"
     
     test_data_status = {
         'timestamp': datetime.now(timezone.utc).isoformat(),
-        'cutoff_time': cutoff_time.isoformat(),
+        'cutoff_time': cutoff_iso,
         'hours_back': hours_back,
         'total_test_prospects': 0,
         'user_breakdown': []
     }
     
-    total_test_prospects = 0
-    
-    for user in config.test_users:
+    def check_user(user: TestUser) -> Tuple[Dict[str, Any], int, str]:
         user_test_data = {
             'user_id': user.user_id,
             'email': user.email,
@@ -162,24 +216,24 @@ def check_recent_test_data(config: TestConfig, hours_back: int = 24) -> Dict[str
             # Look for test prospects
             test_prospects = api_client.find_test_prospects(
                 user.user_id,
-                f"TestRecord_{config.integration_type.title()}",
-                created_after=cutoff_time.isoformat()
+                test_pattern,
+                created_after=cutoff_iso
             )
             
             user_test_data['test_prospects_found'] = len(test_prospects)
-            total_test_prospects += len(test_prospects)
             
             if len(test_prospects) > 0:
-                logger.info(f"✓ Found {len(test_prospects)} test prospects for {user.email}")
-            else:
-                logger.info(f"- No test prospects found for {user.email}")
+                return user_test_data, logging.INFO, f"✓ Found {len(test_prospects)} test prospects for {user.email}"
+            return user_test_data, logging.INFO, f"- No test prospects found for {user.email}"
             
         except Exception as e:
             user_test_data['error'] = str(e)
-            logger.error(f"✗ Error checking test data for {user.email}: {e}")
-        
-        test_data_status['user_breakdown'].append(user_test_data)
+            return user_test_data, logging.ERROR, f"✗ Error checking test data for {user.email}: {e}"
     
+    with BonzoAPIClient(config.superuser_api_key) as api_client:
+        test_data_status['user_breakdown'] = _map_test_users(check_user, config.test_users)
+    
+    total_test_prospects = sum(user_test_data['test_prospects_found'] for user_test_data in test_data_status['user_breakdown'])
     test_data_status['total_test_prospects'] = total_test_prospects
     logger.info(f"Total test prospects found: {total_test_prospects}")
     
@@ -200,22 +254,23 @@ def run_integration_health_check(config: TestConfig, check_test_data: bool = Tru
     }
     
     try:
-        # Check webhook health
-        webhook_health = check_webhook_health(config)
-        health_report['checks']['webhook_health'] = webhook_health
-        
-        # Check API connectivity
-        api_health = check_api_connectivity(config)
-        health_report['checks']['api_connectivity'] = api_health
-        
-        # Check recent test data if requested
-        if check_test_data:
-            test_data_health = check_recent_test_data(config)
-            health_report['checks']['recent_test_data'] = test_data_health
+        # The checks hit independent endpoints, so run them at the same time
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'webhook_health': executor.submit(check_webhook_health, config),
+                'api_connectivity': executor.submit(check_api_connectivity, config)
+            }
+            
+            # Check recent test data if requested
+            if check_test_data:
+                futures['recent_test_data'] = executor.submit(check_recent_test_data, config)
+            
+            for check_name, future in futures.items():
+                health_report['checks'][check_name] = future.result()
         
         # Determine overall status
-        webhook_ok = webhook_health['status'] == 'healthy'
-        api_ok = api_health['status'] == 'healthy'
+        webhook_ok = health_report['checks']['webhook_health']['status'] == 'healthy'
+        api_ok = health_report['checks']['api_connectivity']['status'] == 'healthy'
         
         if webhook_ok and api_ok:
             health_report['overall_status'] = 'healthy'
@@ -244,8 +299,7 @@ def save_health_report(health_report: Dict[str, Any], output_file: Optional[str]
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(health_report, f, indent=2)
+    json_io.write_json_atomic(output_path, health_report, durable=False)
     
     logger.info(f"Health report saved to: {output_path}")
     return str(output_path)
@@ -253,40 +307,40 @@ def save_health_report(health_report: Dict[str, Any], output_file: Optional[str]
 
 def print_health_summary(health_report: Dict[str, Any]) -> None:
     """Print a summary of the health check results."""
-    print("\n" + "="*60)
-    print(f"INTEGRATION HEALTH SUMMARY")
-    print("="*60)
-    print(f"Integration: {health_report['integration_type']}")
-    print(f"Overall Status: {health_report['overall_status'].upper()}")
-    print(f"Check Time: {health_report['check_timestamp']}")
-    print()
+    lines = [
+        "",
+        "="*60,
+        "INTEGRATION HEALTH SUMMARY",
+        "="*60,
+        f"Integration: {health_report['integration_type']}",
+        f"Overall Status: {health_report['overall_status'].upper()}",
+        f"Check Time: {health_report['check_timestamp']}",
+        "",
+    ]
     
     for check_name, check_data in health_report.get('checks', {}).items():
         status = check_data.get('status', 'unknown')
-        status_symbol = {
-            'healthy': '✓',
-            'partial': '⚠',
-            'unhealthy': '✗',
-            'unknown': '?'
-        }.get(status, '?')
+        status_symbol = _STATUS_SYMBOLS.get(status, '?')
+        check_title = _CHECK_TITLES.get(check_name) or check_name.replace('_', ' ').title()
         
-        print(f"{status_symbol} {check_name.replace('_', ' ').title()}: {status.upper()}")
+        lines.append(f"{status_symbol} {check_title}: {status.upper()}")
         
         if check_name == 'webhook_health':
             response_time = check_data.get('response_time', 0)
-            print(f"    Response Time: {response_time:.3f}s")
+            lines.append(f"    Response Time: {response_time:.3f}s")
             
         elif check_name == 'api_connectivity':
             accessible = check_data.get('users_accessible', 0)
             total = check_data.get('total_users', 0)
-            print(f"    Users Accessible: {accessible}/{total}")
+            lines.append(f"    Users Accessible: {accessible}/{total}")
             
         elif check_name == 'recent_test_data':
             prospects = check_data.get('total_test_prospects', 0)
             hours = check_data.get('hours_back', 24)
-            print(f"    Test Prospects ({hours}h): {prospects}")
+            lines.append(f"    Test Prospects ({hours}h): {prospects}")
     
-    print("="*60)
+    lines.append("="*60)
+    print("\n".join(lines))
 
 
 def main():
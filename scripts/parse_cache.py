@@ -0,0 +1,42 @@
+"""
+Stat-keyed cache for parsed config and template files.
+"""
+
+import os
+from typing import Any, Callable, Dict, Tuple
+
+# Parsed data already loaded in this process, keyed by path
+_loaded: Dict[str, Tuple[tuple, Any]] = {}
+
+
+def load_parsed(path: str, parse: Callable[[bytes], Any]) -> Any:
+    """
+    Parse a file, reusing an earlier result while the file is unchanged.
+    
+    Results are kept in memory for this process only, keyed by the file's
+    mtime and size, so nothing parsed (such as configs with API keys) is
+    written to disk. The returned object is shared between callers and
+    must not be mutated.
+    
+    Args:
+        path: File to load
+        parse: Function turning the file's bytes into the parsed data
+    
+    Returns:
+        The parsed data
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = os.stat(path)
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == cache_key:
+        return loaded[1]
+    
+    with open(path, 'rb') as f:
+        data = parse(f.read())
+    
+    _loaded[path] = (cache_key, data)
+    return data
@@ -2,7 +2,6 @@
 Test data factory for generating bulk test records.
 """
 
-import json
 import random
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
@@ -10,6 +9,8 @@ from dataclasses import dataclass
 import string
 import logging
 
+from app import json_io
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +38,8 @@ class DataFactory:
         """
         self.config = config
         self.payload_template = payload_template
+        # Serialized once; each record's payload is parsed from a substituted copy
+        self._template_str = json_io.dumps(payload_template).decode('utf-8')
         self.test_data_settings = getattr(config, 'test_data_settings', {})
         
     def generate_test_records(self, test_run_id: str) -> List[Record]:
@@ -133,16 +136,11 @@ class DataFactory:
         Returns:
             Generated payload dictionary
         """
-        # Start with template
-        payload = json.loads(json.dumps(self.payload_template))
-        
         # Generate test data
         test_data = self._generate_test_data(record_id, sequence_number)
         
-        # Replace template variables
-        payload = self._replace_template_variables(payload, user, test_data, record_id)
-        
-        return payload
+        # Replace template variables in the serialized template
+        return self._replace_template_variables(self._template_str, user, test_data, record_id)
     
     def _generate_test_data(self, record_id: str, sequence_number: int) -> Dict[str, Any]:
         """Generate random test data for a record."""
@@ -197,7 +195,7 @@ class DataFactory:
     
     def _replace_template_variables(
         self, 
-        payload: Dict[str, Any], 
+        payload_str: str, 
         user, 
         test_data: Dict[str, Any],
         record_id: str
@@ -206,7 +204,7 @@ class DataFactory:
         Replace template variables in payload with actual values.
         
         Args:
-            payload: Payload dictionary with template variables
+            payload_str: Serialized payload with template variables
             user: TestUser object
             test_data: Generated test data
             record_id: Unique record identifier
@@ -214,9 +212,6 @@ class DataFactory:
         Returns:
             Payload with replaced variables
         """
-        # Convert to JSON string for easy replacement
-        payload_str = json.dumps(payload)
-        
         # User-related replacements
         payload_str = payload_str.replace('{user.email}', user.email)
         payload_str = payload_str.replace('{user.id}', str(user.user_id))
@@ -231,7 +226,7 @@ class DataFactory:
         payload_str = payload_str.replace('{record_id}', record_id)
         
         # Convert back to dictionary
-        return json.loads(payload_str)
+        return json_io.loads(payload_str)
     
     def validate_test_records(self, records: List[Record]) -> Dict[str, Any]:
         """
@@ -323,8 +318,7 @@ class DataFactory:
             ]
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        json_io.write_json_atomic(output_file, export_data, durable=False)
         
         logger.info(f"Exported {len(records)} test records to {output_file}")
 
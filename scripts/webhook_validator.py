@@ -4,15 +4,19 @@ Webhook delivery testing utilities for bulk integration testing.
 
 import asyncio
 import aiohttp
-import json
 import time
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import concurrent.futures
 from urllib.parse import urlparse
 
+from app import json_io
+
+if TYPE_CHECKING:
+    import requests
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,16 +75,20 @@ class WebhookDeliveryStats:
 class WebhookValidator:
     """Validator for testing webhook delivery and responses."""
     
-    def __init__(self, config, webhook_url: Optional[str] = None):
+    def __init__(self, config, webhook_url: Optional[str] = None, session: Optional['requests.Session'] = None):
         """
         Initialize webhook validator.
         
         Args:
             config: Test configuration object
             webhook_url: Custom webhook URL to override config default
+            session: Session for synchronous requests, so callers can keep
+                connections alive across validators (default: a new
+                connection per request)
         """
         self.config = config
         self.webhook_url = webhook_url or config.webhook_url
+        self.session = session
         self.webhook_settings = getattr(config, 'webhook_settings', {})
         self.timeout = self.webhook_settings.get('timeout', 30)
         self.retry_attempts = self.webhook_settings.get('retry_attempts', 3)
@@ -237,6 +245,7 @@ class WebhookValidator:
         """
         import requests
         
+        http = self.session or requests
         last_response = None
         
         for attempt in range(self.retry_attempts):
@@ -250,7 +259,7 @@ class WebhookValidator:
                 
                 logger.debug(f"Sending webhook for record {record_id} (attempt {attempt + 1})")
                 
-                response = requests.post(
+                response = http.post(
                     self.webhook_url,
                     json=payload,
                     headers=headers,
@@ -319,6 +328,7 @@ class WebhookValidator:
         """
         import requests
         
+        http = self.session or requests
         results = {
             'endpoint_reachable': False,
             'supports_post': False,
@@ -338,7 +348,7 @@ class WebhookValidator:
             test_payload = {"test": "endpoint_validation"}
             start_time = time.time()
             
-            response = requests.post(
+            response = http.post(
                 self.webhook_url,
                 json=test_payload,
                 headers={'Content-Type': 'application/json'},
@@ -429,8 +439,7 @@ class WebhookValidator:
         }
         
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            json_io.write_json_atomic(output_file, report, durable=False)
             logger.info(f"Delivery report saved to {output_file}")
         
         return report
\ No newline at end of file
@@ -188,17 +188,21 @@ class TestMonitorbaseIntegration:
             for prospect in prospects:
                 total_prospects += 1
                 
-                # Validate assignment
-                assignment_validation = self.api_client.validate_prospect_assignment(
+                # Validate assignment; the per-field breakdown is only needed for errors
+                if self.api_client.is_prospect_assigned_correctly(
                     prospect,
                     expected_user_email=user.email,
                     expected_user_id=user.user_id,
                     expected_team_id=user.team_id
-                )
-                
-                if all(assignment_validation.values()):
+                ):
                     correct_assignments += 1
                 else:
+                    assignment_validation = self.api_client.validate_prospect_assignment(
+                        prospect,
+                        expected_user_email=user.email,
+                        expected_user_id=user.user_id,
+                        expected_team_id=user.team_id
+                    )
                     assignment_errors.append({
                         'prospect_id': prospect.id,
                         'prospect_name': prospect.full_name,